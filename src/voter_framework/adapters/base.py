@@ -4,7 +4,7 @@ Base adapter for state-specific voter data access.
 
 from abc import ABC, abstractmethod
 import pandas as pd
-from typing import Dict, Optional
+from typing import Dict, Iterator, Optional
 from ..normalizers.base import BaseDataNormalizer
 
 class BaseStateAdapter(ABC):
@@ -30,6 +30,24 @@ class BaseStateAdapter(ABC):
         """
         pass
     
+    def fetch_data_iter(self, chunksize: int = 500_000) -> Iterator[pd.DataFrame]:
+        """
+        Fetch voter registration data from the state in chunks.
+        
+        The default implementation slices the result of fetch_data(); adapters
+        that can read their source incrementally (e.g. read_csv with chunksize)
+        should override this so the full raw frame is never held in memory.
+        
+        Args:
+            chunksize: Maximum number of rows per chunk
+            
+        Yields:
+            DataFrames containing raw voter data, at least one (possibly empty)
+        """
+        data = self.fetch_data()
+        for start in range(0, max(len(data), 1), chunksize):
+            yield data.iloc[start:start + chunksize]
+    
     def get_normalizer(self) -> BaseDataNormalizer:
         """
         Get the normalizer for this state's data format.
@@ -2,7 +2,18 @@
 CLI tools for the voter registration framework.
 """
 
-from .onboard_state import main as onboard_state_main
-from .import_to_sqlite import main as import_to_sqlite_main
+from importlib import import_module
 
-__all__ = ['onboard_state_main', 'import_to_sqlite_main'] 
\ No newline at end of file
+__all__ = ['onboard_state_main', 'import_to_sqlite_main']
+
+# Entry points are resolved on first access so that running one tool does not
+# import the others (import_to_sqlite pulls in pandas)
+_ENTRY_POINT_MODULES = {
+    'onboard_state_main': '.onboard_state',
+    'import_to_sqlite_main': '.import_to_sqlite',
+}
+
+def __getattr__(name):
+    if name in _ENTRY_POINT_MODULES:
+        return import_module(_ENTRY_POINT_MODULES[name], __name__).main
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -4,12 +4,14 @@ CLI tool for importing voter registration data into SQLite database.
 """
 
 import argparse
+import functools
+import operator
 import os
 import sqlite3
 from datetime import datetime
 import pandas as pd
 import yaml
-from typing import Dict, Optional, List, Any
+from typing import Dict, Iterator, Optional, List, Any
 from ..adapters.base import BaseStateAdapter
 from ..normalizers.base import BaseDataNormalizer
 import csv
@@ -77,7 +79,7 @@ def load_state_config(state_code: str) -> Dict:
     
     # Try JSON first
     if os.path.exists(json_config):
-        with open(json_config, 'r') as f:
+        with open(json_config, 'r', encoding='utf-8') as f:
             config = json.load(f)
     # Try YAML as fallback
     elif os.path.exists(yaml_config):
@@ -122,13 +124,17 @@ def create_table(conn: sqlite3.Connection, table_name: str, force: bool = False)
         table_name: Name of the table to create
         force: If True, drop existing table before creating
     """
+    # A transaction the caller already opened is left for the caller to commit
+    owns_transaction = not conn.in_transaction
+    
     if force:
         print(f"Dropping table {table_name} if it exists...")
-        conn.execute(f"DROP TABLE IF EXISTS {table_name}")
-        conn.commit()
+        conn.execute(f"DROP TABLE IF EXISTS {_quote_identifier(table_name)}")
+        if owns_transaction:
+            conn.commit()
     
     sql = f"""
-    CREATE TABLE IF NOT EXISTS {table_name} (
+    CREATE TABLE IF NOT EXISTS {_quote_identifier(table_name)} (
         id INTEGER PRIMARY KEY AUTOINCREMENT,
         first_name TEXT,
         last_name TEXT,
@@ -174,13 +180,56 @@ def create_table(conn: sqlite3.Connection, table_name: str, force: bool = False)
 
     # Create index for address-based queries
     index_sql = f"""
-    CREATE INDEX IF NOT EXISTS idx_{table_name}_address
-    ON {table_name}(address, city, zip_code)
+    CREATE INDEX IF NOT EXISTS {_quote_identifier(f'idx_{table_name}_address')}
+    ON {_quote_identifier(table_name)}(address, city, zip_code)
     """
     print(f"Creating index with SQL: {index_sql}")
     conn.execute(index_sql)
 
-    conn.commit()
+    if owns_transaction:
+        conn.commit()
+
+def join_address_parts(address_parts: List[pd.Series], separator: str) -> pd.Series:
+    """Join address component columns row-wise, skipping blank components.
+    
+    Each component is prefixed with the separator (or blanked when empty) and
+    the columns are concatenated with vectorized string adds, instead of
+    joining every row in Python; the leading separator is then sliced off.
+    
+    Args:
+        address_parts: Address component columns, with missing values as ''
+        separator: String placed between non-blank components
+        
+    Returns:
+        Series of combined addresses
+    """
+    pieces = []
+    for part in address_parts:
+        part = part.astype(str)
+        pieces.append((separator + part).where(part.str.strip() != '', ''))
+    return functools.reduce(operator.add, pieces).str[len(separator):]
+
+def _quote_identifier(name: str) -> str:
+    """Quote a table or column name for use in SQL, as to_sql did."""
+    return '"' + name.replace('"', '""') + '"'
+
+def _sqlite_rows(df: pd.DataFrame) -> Iterator[tuple]:
+    """Convert a DataFrame to row tuples sqlite3 can bind.
+    
+    Datetime columns are written as 'YYYY-MM-DD HH:MM:SS' text, as to_sql
+    stored them, and missing values become NULL.
+    
+    Args:
+        df: DataFrame with columns in insert order
+        
+    Returns:
+        Iterator of row tuples
+    """
+    datetime_cols = [col for col in df.columns if pd.api.types.is_datetime64_any_dtype(df[col])]
+    if datetime_cols:
+        df = df.assign(**{col: df[col].dt.strftime('%Y-%m-%d %H:%M:%S') for col in datetime_cols})
+    rows = df.astype(object).where(df.notna(), None)
+    return rows.itertuples(index=False, name=None)
 
 def import_data(conn: sqlite3.Connection, table_name: str, df: pd.DataFrame, mappings: Dict[str, str], address_fields: Dict[str, Any], force: bool = False, state_code: str = None) -> None:
     """Import data into SQLite database.
@@ -218,82 +267,102 @@ def import_data(conn: sqlite3.Connection, table_name: str, df: pd.DataFrame, map
     processed_rows = 0
     unique_violations = []
     
-    # Process data in chunks
-    for chunk_start in range(0, total_rows, chunk_size):
-        chunk_end = min(chunk_start + chunk_size, total_rows)
-        df_chunk = df.iloc[chunk_start:chunk_end]
-        
-        # Map columns to schema for this chunk
-        df_mapped = pd.DataFrame()
-        
-        # Create case-insensitive column lookup for DataFrame columns
-        df_col_lookup = {col.lower(): col for col in df_chunk.columns}
-        
-        # Use the mappings from the config file
-        for orig_col, schema_field in mappings.items():
-            if not schema_field.startswith('address_'):
-                # Find the actual column name in the DataFrame that matches case-insensitively
-                actual_col = next((df_col_lookup[col_lower] for col_lower in df_col_lookup 
-                                if col_lower == orig_col.lower()), None)
-                if actual_col:
-                    # No need to prefix voter_id since each state has its own table
-                    df_mapped[schema_field] = df_chunk[actual_col]
-        
-        # Set state code from command line argument
-        if state_code:
-            df_mapped['state'] = state_code.upper()
-        
-        # Handle address fields
-        if 'address' in address_fields:
-            fields = address_fields['address']['fields']
-            separator = address_fields['address'].get('separator', ' ')
+    # Create case-insensitive column lookup for DataFrame columns; every chunk
+    # shares the same columns, so the lookups are built once up front
+    df_col_lookup = {col.lower(): col for col in df.columns}
+    
+    # Case-insensitive lookup of address component mappings
+    address_mappings = {orig_col.lower(): schema_field for orig_col, schema_field in mappings.items()
+                        if schema_field.startswith('address_')}
+    
+    # Run the whole import in one transaction so SQLite syncs to disk once at
+    # the end rather than once per chunk; each chunk gets its own savepoint so
+    # a chunk with UNIQUE violations can be undone without losing the others.
+    # A transaction the caller already opened is left for the caller to end.
+    owns_transaction = not conn.in_transaction
+    if owns_transaction:
+        conn.execute("BEGIN")
+    
+    try:
+        # Process data in chunks
+        for chunk_start in range(0, total_rows, chunk_size):
+            chunk_end = min(chunk_start + chunk_size, total_rows)
+            df_chunk = df.iloc[chunk_start:chunk_end]
             
-            # Check if we have a single combined address field
-            if len(fields) == 1:
-                field_lower = fields[0].lower()
-                if field_lower in df_col_lookup:
-                    df_mapped['address'] = df_chunk[df_col_lookup[field_lower]]
-            else:
-                # Handle individual address components
-                address_parts = []
+            # Map columns to schema for this chunk
+            df_mapped = pd.DataFrame()
+            
+            # Use the mappings from the config file
+            for orig_col, schema_field in mappings.items():
+                if not schema_field.startswith('address_'):
+                    # Find the actual column name in the DataFrame that matches case-insensitively
+                    actual_col = df_col_lookup.get(orig_col.lower())
+                    if actual_col:
+                        # No need to prefix voter_id since each state has its own table
+                        df_mapped[schema_field] = df_chunk[actual_col]
+            
+            # Set state code from command line argument
+            if state_code:
+                df_mapped['state'] = state_code.upper()
+            
+            # Handle address fields
+            if 'address' in address_fields:
+                fields = address_fields['address']['fields']
+                separator = address_fields['address'].get('separator', ' ')
                 
-                # Generic address handling for other states
-                for field in fields:
-                    field_lower = field.lower()
+                # Check if we have a single combined address field
+                if len(fields) == 1:
+                    field_lower = fields[0].lower()
                     if field_lower in df_col_lookup:
-                        actual_col = df_col_lookup[field_lower]
-                        # Map to appropriate schema field if it exists in mappings
-                        for orig_col, schema_field in mappings.items():
-                            if orig_col.lower() == field_lower and schema_field.startswith('address_'):
+                        df_mapped['address'] = df_chunk[df_col_lookup[field_lower]]
+                else:
+                    # Handle individual address components
+                    address_parts = []
+                    
+                    # Generic address handling for other states
+                    for field in fields:
+                        field_lower = field.lower()
+                        if field_lower in df_col_lookup:
+                            actual_col = df_col_lookup[field_lower]
+                            # Map to appropriate schema field if it exists in mappings
+                            schema_field = address_mappings.get(field_lower)
+                            if schema_field:
                                 df_mapped[schema_field] = df_chunk[actual_col]
-                        # Add to address parts if it's a valid field
-                        if df_chunk[actual_col].notna().any():  # Only include non-empty fields
-                            address_parts.append(df_chunk[actual_col].fillna(''))
-                
-                # Create combined address field
-                if address_parts:
-                    df_mapped['address'] = pd.DataFrame(address_parts).T.apply(
-                        lambda x: separator.join(str(val) for val in x if pd.notna(val) and str(val).strip()),
-                        axis=1
-                    )
-        
-        try:
-            # Insert chunk into database
-            df_mapped.to_sql(table_name, conn, if_exists='append', index=False)
+                            # Add to address parts if it's a valid field
+                            if df_chunk[actual_col].notna().any():  # Only include non-empty fields
+                                address_parts.append(df_chunk[actual_col].fillna(''))
+                    
+                    # Create combined address field
+                    if address_parts:
+                        df_mapped['address'] = join_address_parts(address_parts, separator)
+            
+            # Nothing in the file maps to a table column, so there is nothing to insert
+            if df_mapped.columns.empty:
+                continue
             
-            # Update progress
-            processed_rows += len(df_chunk)
-            progress_pct = (processed_rows / total_rows) * 100
-            print(f"\rImported {processed_rows:,} records out of {total_rows:,} ({progress_pct:.1f}%)", end='', flush=True)
+            # Quote names, since mapped fields may be keywords or contain spaces
+            rows = _sqlite_rows(df_mapped)
+            columns = ', '.join(map(_quote_identifier, df_mapped.columns))
+            placeholders = ', '.join('?' * len(df_mapped.columns))
+            insert_sql = f"INSERT INTO {_quote_identifier(table_name)} ({columns}) VALUES ({placeholders})"
             
-        except sqlite3.IntegrityError as e:
-            if "UNIQUE constraint failed" in str(e):
+            conn.execute("SAVEPOINT import_chunk")
+            try:
+                # Insert chunk into database
+                conn.executemany(insert_sql, rows)
+            except Exception as e:
+                # Undo only this chunk; earlier chunks stay in the transaction
+                conn.execute("ROLLBACK TO SAVEPOINT import_chunk")
+                conn.execute("RELEASE SAVEPOINT import_chunk")
+                if not (isinstance(e, sqlite3.IntegrityError) and "UNIQUE constraint failed" in str(e)):
+                    raise  # Re-raise if it's not a UNIQUE constraint error
+                
                 # Extract the voter_id from the error message
                 error_msg = str(e)
                 if "voter_id" in error_msg:
                     # Get the problematic voter_id from the current chunk
                     cursor = conn.cursor()
-                    cursor.execute(f"SELECT voter_id FROM {table_name}")
+                    cursor.execute(f"SELECT voter_id FROM {_quote_identifier(table_name)}")
                     existing_ids = set(row[0] for row in cursor.fetchall())
                     
                     # Find which records in the current chunk have duplicate IDs
@@ -306,7 +375,19 @@ def import_data(conn: sqlite3.Connection, table_name: str, df: pd.DataFrame, map
                                 'state': row.get('state', 'N/A')
                             })
             else:
-                raise  # Re-raise if it's not a UNIQUE constraint error
+                conn.execute("RELEASE SAVEPOINT import_chunk")
+                
+                # Update progress
+                processed_rows += len(df_chunk)
+                progress_pct = (processed_rows / total_rows) * 100
+                print(f"\rImported {processed_rows:,} records out of {total_rows:,} ({progress_pct:.1f}%)", end='', flush=True)
+    except BaseException:
+        if owns_transaction:
+            conn.rollback()
+        raise
+    
+    if owns_transaction:
+        conn.commit()
     
     print()  # New line after progress reporting
     
@@ -383,7 +464,7 @@ def import_main(args):
 
     # Load configuration
     try:
-        with open(config_file, 'r') as f:
+        with open(config_file, 'r', encoding='utf-8') as f:
             config = json.load(f)
     except FileNotFoundError:
         print(f"Error: Configuration file not found: {config_file}")
@@ -454,10 +535,10 @@ def import_main(args):
         if getattr(args, 'verbose', False):
             # Get final table statistics
             cursor = conn.cursor()
-            cursor.execute(f"SELECT COUNT(*) FROM {table_name}")
+            cursor.execute(f"SELECT COUNT(*) FROM {_quote_identifier(table_name)}")
             row_count = cursor.fetchone()[0]
             
-            cursor.execute(f"PRAGMA table_info({table_name})")
+            cursor.execute(f"PRAGMA table_info({_quote_identifier(table_name)})")
             columns = cursor.fetchall()
             
             print(f"\nImport Complete:")
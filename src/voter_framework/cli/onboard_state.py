@@ -6,15 +6,148 @@ CLI tool for onboarding new state voter registration data.
 import argparse
 import csv
 import os
+import re
+from collections import defaultdict
 from datetime import datetime
 import yaml
-from typing import Dict, List, Optional, Any
-import pandas as pd
-from ..adapters.base import BaseStateAdapter
-from ..normalizers.base import BaseDataNormalizer
+from typing import Dict, List, Optional, Tuple, Any
 import json
 import sys
 
+try:
+    import orjson
+except ImportError:  # optional; the stdlib encoder is used without it
+    orjson = None
+
+# Number of bytes read from the start of a file when sniffing its header
+HEADER_PROBE_SIZE = 64 * 1024
+
+# Default directory for state configuration files (configs/ in the project root)
+DEFAULT_CONFIG_DIR = os.path.join(os.path.dirname(__file__), '..', '..', '..', 'configs')
+
+# Common patterns in column names
+_NAME_PATTERNS = {
+    'first_name': ('first', 'given', 'fname', 'firstname', 'name_first', 'fname'),
+    'last_name': ('last', 'surname', 'lname', 'lastname', 'name_last', 'lname'),
+    'middle_name': ('middle', 'mname', 'middlename', 'name_middle', 'mname'),
+    'birth_year': ('birth', 'dob', 'birthdate', 'date_of_birth', 'birthyear', 'birth_year'),
+    'birthday': ('birthday', 'day_of_birth'),
+    'registration_date': ('registrationdate', 'regdate', 'registration_date', 'reg_date'),
+    'city': ('city', 'town', 'regcity', 'municipality'),
+    'state': ('state', 'regstate', 'province'),
+    'zip_code': ('zip', 'postal', 'zipcode', 'regzipcode', 'postal_code'),
+    'gender': ('sex', 'gender'),
+    'party': ('party', 'political', 'affiliation', 'registration_party'),
+    'precinct': ('precinct', 'district', 'precinctcode', 'precinct_id', 'voting_district'),
+    'county': ('county', 'parish', 'countycode', 'county_name', 'jurisdiction'),
+    'voter_id': ('voterid', 'voter_id', 'statevoterid', 'voter', 'votid', 'id', 'registration_id'),
+    'legislative_district': ('legislativedistrict', 'legdistrict', 'leg_district', 'state_house'),
+    'congressional_district': ('congressionaldistrict', 'congdistrict', 'cong_district', 'us_house'),
+    'last_voted_date': ('lastvoted', 'last_voted', 'lastvoteddate', 'last_vote_date'),
+    'status_code': ('statuscode', 'status', 'voter_status', 'registration_status')
+}
+
+# Address field patterns
+_ADDRESS_PATTERNS = {
+    'address_street_number': ('stnum', 'street_number', 'housenumber', 'regstnum', 'stnumber', 'address_number', 'streetno', 'house_number'),
+    'address_street_fraction': ('stfrac', 'fraction', 'regstfrac', 'address_frac', 'street_fraction'),
+    'address_street_pre_direction': ('stpredir', 'predirection', 'regstpredirection', 'address_dir_pre', 'streetdir', 'street_direction'),
+    'address_street_name': ('stname', 'street_name', 'regstname', 'address_street', 'streetname', 'street'),
+    'address_street_type': ('sttype', 'street_type', 'regsttype', 'address_suffix', 'streettype', 'street_suffix'),
+    'address_unit_type': ('unittype', 'regunittype', 'address_unit_type', 'apartment_type'),
+    'address_street_post_direction': ('stpostdir', 'postdirection', 'regstpostdirection', 'address_dir_post', 'street_post_dir'),
+    'address_unit_number': ('unitnum', 'regstunitnum', 'address_unit', 'unitno', 'apartment_number')
+}
+
+# Mailing address patterns
+_MAILING_PATTERNS = {
+    'mailing_address': ('mail1', 'mailingaddress', 'mail_address', 'mail_addr'),
+    'mailing_address2': ('mail2', 'mailingaddress2', 'mail_address2', 'mail_addr2'),
+    'mailing_address3': ('mail3', 'mailingaddress3', 'mail_address3', 'mail_addr3'),
+    'mailing_city': ('mailcity', 'mail_city'),
+    'mailing_state': ('mailstate', 'mail_state'),
+    'mailing_zip': ('mailzip', 'mail_zip', 'mailing_postal_code'),
+    'mailing_country': ('mailcountry', 'mail_country')
+}
+
+# Common patterns for address components, used to order address fields
+_ADDRESS_COMPONENT_PATTERNS = {
+    'street_number': ('stnum', 'street_number', 'housenumber', 'regstnum', 'stnumber', 'address_number', 'streetno', 'res_street_number'),
+    'street_fraction': ('stfrac', 'fraction', 'regstfrac', 'address_frac', 'res_street_fraction'),
+    'street_pre_direction': ('stpredir', 'predirection', 'regstpredirection', 'address_dir_pre', 'streetdir', 'res_street_pre_direction'),
+    'street_name': ('stname', 'street_name', 'regstname', 'address_street', 'streetname', 'res_street_name'),
+    'street_type': ('sttype', 'street_type', 'regsttype', 'address_suffix', 'streettype', 'res_street_type'),
+    'unit_type': ('unittype', 'regunittype', 'address_unit_type', 'res_unit_type'),
+    'street_post_direction': ('stpostdir', 'postdirection', 'regstpostdirection', 'address_dir_post', 'res_street_post_direction'),
+    'unit_number': ('unitnum', 'regstunitnum', 'address_unit', 'unitno', 'res_unit_number'),
+    'city': ('city', 'regcity', 'res_city'),
+    'state': ('state', 'regstate', 'res_state'),
+    'zip': ('zip', 'zipcode', 'regzipcode', 'res_zip')
+}
+
+# Patterns for mailing address fields - we specifically want to exclude these
+_MAILING_EXCLUDE_PATTERNS = (
+    'mail', 'mailing', 'mailcity', 'mailstate', 'mailzip', 'mailcountry'
+)
+
+# Voter ID patterns - we want to exclude these too
+_VOTER_ID_EXCLUDE_PATTERNS = (
+    'voterid', 'voter_id', 'statevoterid', 'voter', 'votid', 'id'
+)
+
+# Combined address field patterns
+_FULL_ADDRESS_PATTERNS = ('address_full', 'full_address', 'complete_address')
+
+def _compile_patterns(patterns: Tuple[str, ...]) -> re.Pattern:
+    """Compile a list of substrings into a single regex matching any of them."""
+    return re.compile('|'.join(map(re.escape, patterns)))
+
+def _column_rules(field_patterns: Dict[str, Tuple[str, ...]]) -> List[tuple]:
+    """Build (schema_field, compiled_regex) rules for analyze_columns."""
+    return [(field, _compile_patterns(patterns)) for field, patterns in field_patterns.items()]
+
+# Column mapping rules in priority order: name fields, then address fields, then
+# mailing address fields
+_COLUMN_RULES = tuple(
+    _column_rules(_NAME_PATTERNS) +
+    _column_rules(_ADDRESS_PATTERNS) +
+    _column_rules(_MAILING_PATTERNS)
+)
+
+# Field whose pattern a column name equals exactly; that column goes to this
+# field only, never to another field by a partial match (StateVoterID is never
+# the state column). Since no two fields claim the same column, a mapped column
+# is never remapped.
+_EXACT_PATTERN_FIELDS = {
+    pattern: field
+    for field_patterns in (_NAME_PATTERNS, _ADDRESS_PATTERNS, _MAILING_PATTERNS)
+    for field, patterns in field_patterns.items()
+    for pattern in patterns
+}
+
+# Precompiled substring matchers for analyze_address_fields
+_ADDRESS_COMPONENT_REGEXES = {component: _compile_patterns(patterns) for component, patterns in _ADDRESS_COMPONENT_PATTERNS.items()}
+_MAILING_EXCLUDE_REGEX = _compile_patterns(_MAILING_EXCLUDE_PATTERNS)
+_VOTER_ID_EXCLUDE_REGEX = _compile_patterns(_VOTER_ID_EXCLUDE_PATTERNS)
+_FULL_ADDRESS_REGEX = _compile_patterns(_FULL_ADDRESS_PATTERNS)
+
+def _pick_delimiter(line: str) -> tuple[str, str]:
+    """
+    Pick the delimiter that occurs most often in a header line.
+    
+    Args:
+        line: Decoded header line
+        
+    Returns:
+        Tuple of (format, delimiter); ties go to ',' then '|', and a line with
+        none of the candidates is treated as tab-delimited
+    """
+    counts = {delimiter: line.count(delimiter) for delimiter in (',', '|', '\t')}
+    delimiter = max(counts, key=counts.get)
+    if not counts[delimiter]:
+        delimiter = '\t'
+    return ('csv' if delimiter == ',' else 'text'), delimiter
+
 def detect_file_format(file_path: str) -> tuple[str, str, List[str]]:
     """
     Detect the format of the input file and read column names.
@@ -26,223 +159,105 @@ def detect_file_format(file_path: str) -> tuple[str, str, List[str]]:
         Tuple of (format, delimiter, column_names) where format is 'csv' or 'text', 
         delimiter is ',' or '|' or '\t', and column_names is a list of column names
     """
-    # Try different encodings
-    encodings = ['utf-8', 'latin1', 'cp1252', 'iso-8859-1']
-    for encoding in encodings:
+    # Read the header bytes with a single unbuffered read; only the first line
+    # is needed, so the text-mode I/O stack would be pure overhead here
+    fd = os.open(file_path, os.O_RDONLY)
+    try:
+        head = os.read(fd, HEADER_PROBE_SIZE)
+    finally:
+        os.close(fd)
+    raw_line = head.split(b'\n', 1)[0].split(b'\r', 1)[0]
+    
+    # Decode the header once: utf-8 first, then cp1252 for Windows exports;
+    # latin1 maps every byte, so it is the fallback that always succeeds
+    for encoding in ('utf-8', 'cp1252', 'latin1'):
         try:
-            with open(file_path, 'r', encoding=encoding) as f:
-                first_line = f.readline().strip()
-                # Split the line to get column names
-                if ',' in first_line:
-                    column_names = [col.strip() for col in first_line.split(',')]
-                    return 'csv', ',', column_names
-                elif '|' in first_line:
-                    column_names = [col.strip() for col in first_line.split('|')]
-                    return 'text', '|', column_names
-                else:
-                    column_names = [col.strip() for col in first_line.split('\t')]
-                    return 'text', '\t', column_names
+            first_line = raw_line.decode(encoding).strip()
+            break
         except UnicodeDecodeError:
             continue
-    raise ValueError(f"Could not read file with any of the encodings: {encodings}")
+    
+    file_format, delimiter = _pick_delimiter(first_line)
+    
+    # Split with csv.reader so quoted column names containing the delimiter stay intact
+    column_names = [col.strip() for col in next(csv.reader([first_line], delimiter=delimiter))]
+    return file_format, delimiter, column_names
 
-def analyze_columns(df: pd.DataFrame) -> Dict[str, str]:
+def analyze_columns(column_names: List[str], col_lookup: Optional[Dict[str, str]] = None) -> Dict[str, str]:
     """
-    Analyze DataFrame columns to suggest mappings to common schema.
+    Analyze column names to suggest mappings to common schema.
     
     Args:
-        df: DataFrame containing voter data
+        column_names: List of column names from the file header
+        col_lookup: Optional prebuilt map of lowercased column name to column name
         
     Returns:
         Dictionary mapping state columns to common schema fields
     """
-    # Common patterns in column names
-    name_patterns = {
-        'first_name': ['first', 'given', 'fname', 'firstname', 'name_first', 'fname'],
-        'last_name': ['last', 'surname', 'lname', 'lastname', 'name_last', 'lname'],
-        'middle_name': ['middle', 'mname', 'middlename', 'name_middle', 'mname'],
-        'birth_year': ['birth', 'dob', 'birthdate', 'date_of_birth', 'birthyear', 'birth_year'],
-        'birthday': ['birthday', 'day_of_birth'],
-        'registration_date': ['registrationdate', 'regdate', 'registration_date', 'reg_date'],
-        'city': ['city', 'town', 'regcity', 'municipality'],
-        'state': ['state', 'regstate', 'province'],
-        'zip_code': ['zip', 'postal', 'zipcode', 'regzipcode', 'postal_code'],
-        'gender': ['sex', 'gender'],
-        'party': ['party', 'political', 'affiliation', 'registration_party'],
-        'precinct': ['precinct', 'district', 'precinctcode', 'precinct_id', 'voting_district'],
-        'county': ['county', 'parish', 'countycode', 'county_name', 'jurisdiction'],
-        'voter_id': ['voterid', 'voter_id', 'statevoterid', 'voter', 'votid', 'id', 'registration_id'],
-        'legislative_district': ['legislativedistrict', 'legdistrict', 'leg_district', 'state_house'],
-        'congressional_district': ['congressionaldistrict', 'congdistrict', 'cong_district', 'us_house'],
-        'last_voted_date': ['lastvoted', 'last_voted', 'lastvoteddate', 'last_vote_date'],
-        'status_code': ['statuscode', 'status', 'voter_status', 'registration_status']
-    }
-    
-    # Address field patterns
-    address_patterns = {
-        'address_street_number': ['stnum', 'street_number', 'housenumber', 'regstnum', 'stnumber', 'address_number', 'streetno', 'house_number'],
-        'address_street_fraction': ['stfrac', 'fraction', 'regstfrac', 'address_frac', 'street_fraction'],
-        'address_street_pre_direction': ['stpredir', 'predirection', 'regstpredirection', 'address_dir_pre', 'streetdir', 'street_direction'],
-        'address_street_name': ['stname', 'street_name', 'regstname', 'address_street', 'streetname', 'street'],
-        'address_street_type': ['sttype', 'street_type', 'regsttype', 'address_suffix', 'streettype', 'street_suffix'],
-        'address_unit_type': ['unittype', 'regunittype', 'address_unit_type', 'apartment_type'],
-        'address_street_post_direction': ['stpostdir', 'postdirection', 'regstpostdirection', 'address_dir_post', 'street_post_dir'],
-        'address_unit_number': ['unitnum', 'regstunitnum', 'address_unit', 'unitno', 'apartment_number']
-    }
-    
-    # Mailing address patterns
-    mailing_patterns = {
-        'mailing_address': ['mail1', 'mailingaddress', 'mail_address', 'mail_addr'],
-        'mailing_address2': ['mail2', 'mailingaddress2', 'mail_address2', 'mail_addr2'],
-        'mailing_address3': ['mail3', 'mailingaddress3', 'mail_address3', 'mail_addr3'],
-        'mailing_city': ['mailcity', 'mail_city'],
-        'mailing_state': ['mailstate', 'mail_state'],
-        'mailing_zip': ['mailzip', 'mail_zip', 'mailing_postal_code'],
-        'mailing_country': ['mailcountry', 'mail_country']
-    }
-    
     mappings = {}
     
-    # Create case-insensitive lookup for DataFrame columns
-    df_col_lookup = {col.lower(): col for col in df.columns}
-    
-    # First map non-address fields with higher priority
-    for schema_field, patterns in name_patterns.items():
-        for col_lower, actual_col in df_col_lookup.items():
-            # Check for exact matches first
-            if any(pattern == col_lower for pattern in patterns):
-                mappings[actual_col] = schema_field
-                break
-            # Then check for partial matches
-            elif any(pattern in col_lower for pattern in patterns):
-                # Skip if this column is already mapped
-                if actual_col not in mappings:
-                    mappings[actual_col] = schema_field
-                    break
-    
-    # Then handle address fields
-    for schema_field, patterns in address_patterns.items():
-        for col_lower, actual_col in df_col_lookup.items():
-            # Skip if this column is already mapped
-            if actual_col in mappings:
-                continue
-            # Check for exact matches first
-            if any(pattern == col_lower for pattern in patterns):
-                mappings[actual_col] = schema_field
-                break
-            # Then check for partial matches
-            elif any(pattern in col_lower for pattern in patterns):
-                mappings[actual_col] = schema_field
-                break
+    # Create case-insensitive lookup for the columns
+    if col_lookup is None:
+        col_lookup = {col.lower(): col for col in column_names}
     
-    # Finally handle mailing address fields
-    for schema_field, patterns in mailing_patterns.items():
-        for col_lower, actual_col in df_col_lookup.items():
-            # Skip if this column is already mapped
-            if actual_col in mappings:
+    for schema_field, pattern_regex in _COLUMN_RULES:
+        # Take the first unmapped column in file order that matches, skipping
+        # columns that exactly match another field's pattern
+        for col_lower, col in col_lookup.items():
+            if col in mappings or _EXACT_PATTERN_FIELDS.get(col_lower, schema_field) != schema_field:
                 continue
-            # Check for exact matches first
-            if any(pattern == col_lower for pattern in patterns):
-                mappings[actual_col] = schema_field
-                break
-            # Then check for partial matches
-            elif any(pattern in col_lower for pattern in patterns):
-                mappings[actual_col] = schema_field
+            if pattern_regex.search(col_lower):
+                mappings[col] = schema_field
                 break
     
     return mappings
 
-def analyze_address_fields(df: pd.DataFrame, column_names: List[str] = None) -> Dict[str, Any]:
+def analyze_address_fields(column_names: List[str], col_lookup: Optional[Dict[str, str]] = None) -> Dict[str, Any]:
     """
-    Analyze data to determine order of address fields.
+    Analyze column names to determine order of address fields.
     
     Args:
-        df: DataFrame containing voter data
-        column_names: Optional list of original column names
+        column_names: List of original column names
+        col_lookup: Optional prebuilt map of lowercased column name to column name
         
     Returns:
         Dictionary containing address field configuration
     """
-    # Common patterns for address components
-    address_patterns = {
-        'street_number': ['stnum', 'street_number', 'housenumber', 'regstnum', 'stnumber', 'address_number', 'streetno', 'res_street_number'],
-        'street_fraction': ['stfrac', 'fraction', 'regstfrac', 'address_frac', 'res_street_fraction'],
-        'street_pre_direction': ['stpredir', 'predirection', 'regstpredirection', 'address_dir_pre', 'streetdir', 'res_street_pre_direction'],
-        'street_name': ['stname', 'street_name', 'regstname', 'address_street', 'streetname', 'res_street_name'],
-        'street_type': ['sttype', 'street_type', 'regsttype', 'address_suffix', 'streettype', 'res_street_type'],
-        'unit_type': ['unittype', 'regunittype', 'address_unit_type', 'res_unit_type'],
-        'street_post_direction': ['stpostdir', 'postdirection', 'regstpostdirection', 'address_dir_post', 'res_street_post_direction'],
-        'unit_number': ['unitnum', 'regstunitnum', 'address_unit', 'unitno', 'res_unit_number'],
-        'city': ['city', 'regcity', 'res_city'],
-        'state': ['state', 'regstate', 'res_state'],
-        'zip': ['zip', 'zipcode', 'regzipcode', 'res_zip']
-    }
-    
-    # Patterns for mailing address fields - we specifically want to exclude these
-    mailing_patterns = [
-        'mail', 'mailing', 'mailcity', 'mailstate', 'mailzip', 'mailcountry'
-    ]
-    
-    # Voter ID patterns - we want to exclude these too
-    voter_id_patterns = [
-        'voterid', 'voter_id', 'statevoterid', 'voter', 'votid', 'id'
-    ]
-    
-    # Use provided column names if available, otherwise get from DataFrame
-    if column_names is None:
-        column_names = df.columns.tolist()
+    # Create case-insensitive lookup for the columns
+    if col_lookup is None:
+        col_lookup = {col.lower(): col for col in column_names}
     
     # First check for a single combined address field
-    for col in column_names:
-        if any(pattern in col.lower() for pattern in ['address_full', 'full_address', 'complete_address']):
+    for col_lower, col in col_lookup.items():
+        if _FULL_ADDRESS_REGEX.search(col_lower):
             return {'address': {'fields': [col], 'separator': ' '}}
             
-    # Define the correct order for address components
-    address_component_order = [
-        'street_number',
-        'street_fraction',
-        'street_pre_direction',
-        'street_name',
-        'street_type',
-        'unit_type',
-        'street_post_direction',
-        'unit_number',
-        'city',
-        'state',
-        'zip'
-    ]
-    
-    # Find columns that match each address component in the correct order
-    address_fields = []
-    column_component_map = {}
+    # Bucket columns by the address component they match, keeping file order within a bucket
+    columns_by_component = defaultdict(list)
     
     # First map columns to components
-    for col in column_names:
-        col_lower = col.lower()
-        
+    for col_lower, col in col_lookup.items():
         # Skip mailing address fields
-        if any(pattern in col_lower for pattern in mailing_patterns):
+        if _MAILING_EXCLUDE_REGEX.search(col_lower):
             continue
             
         # Skip voter ID fields
-        if any(pattern in col_lower for pattern in voter_id_patterns):
+        if _VOTER_ID_EXCLUDE_REGEX.search(col_lower):
             continue
             
         # Map the column to an address component
-        for component, patterns in address_patterns.items():
-            if any(pattern in col_lower for pattern in patterns):
-                column_component_map[col] = component
+        for component, component_regex in _ADDRESS_COMPONENT_REGEXES.items():
+            if component_regex.search(col_lower):
+                columns_by_component[component].append(col)
                 break
     
-    # Then add columns in the correct component order
-    for component in address_component_order:
-        for col, comp in column_component_map.items():
-            if comp == component:
-                address_fields.append(col)
-                
+    # Then add columns in the correct component order; components are declared
+    # in street-address order in _ADDRESS_COMPONENT_PATTERNS
+    address_fields = [col for component in _ADDRESS_COMPONENT_PATTERNS for col in columns_by_component.get(component, ())]
+    
     return {'address': {'fields': address_fields, 'separator': ' '}}
 
-def create_state_config(state: str, file_path: str, mappings: Dict[str, str], df: pd.DataFrame, column_names: List[str], config_dir: Optional[str] = None) -> Dict[str, Any]:
+def create_state_config(state: str, file_path: str, mappings: Dict[str, str], column_names: List[str], config_dir: Optional[str] = None) -> Dict[str, Any]:
     """
     Create a state configuration dictionary and save it to a file.
     
@@ -250,7 +265,6 @@ def create_state_config(state: str, file_path: str, mappings: Dict[str, str], df
         state: Two-letter state code
         file_path: Path to sample voter data file
         mappings: Dictionary mapping state columns to common schema fields
-        df: Sample DataFrame
         column_names: List of column names from the file
         config_dir: Directory to save config file (optional)
     
@@ -260,44 +274,70 @@ def create_state_config(state: str, file_path: str, mappings: Dict[str, str], df
     # Detect file format and delimiter
     file_format, delimiter, _ = detect_file_format(file_path)
     
-    # Create config dictionary
+    # Create config dictionary; a new config is created and last updated at the same instant
+    now_iso = datetime.now().isoformat()
     config = {
         'state_code': state.upper(),
         'file_format': file_format,
         'delimiter': delimiter,
         'column_mappings': mappings,
-        'address_fields': analyze_address_fields(df, column_names),
-        'created_at': datetime.now().isoformat(),
-        'last_updated': datetime.now().isoformat(),
+        'address_fields': analyze_address_fields(column_names),
+        'created_at': now_iso,
+        'last_updated': now_iso,
         'column_names': column_names
     }
     
     # Save config to file
-    if config_dir is None:
-        config_dir = os.path.join(os.path.dirname(__file__), '..', '..', '..', 'configs')
-    
-    os.makedirs(config_dir, exist_ok=True)
-    config_file = os.path.join(config_dir, f'{state.lower()}_config.json')
-    
-    with open(config_file, 'w') as f:
-        json.dump(config, f, indent=2)
+    _write_config(config, state, config_dir)
     
     return config
 
-def save_config(config: Dict, state_code: str):
+def save_config(config: Dict, state_code: str, config_dir: Optional[str] = None):
     """
     Save state configuration to YAML file.
     
     Args:
         config: Configuration dictionary
         state_code: Two-letter state code
+        config_dir: Directory to save config file (optional)
     """
-    config_dir = os.path.join(os.path.dirname(__file__), '..', 'config')
+    _write_config(config, state_code, config_dir, fmt='yaml')
+
+def _write_config(config: Dict[str, Any], state: str, config_dir: Optional[str] = None, fmt: str = 'json') -> str:
+    """
+    Write a state configuration file, creating the config directory if needed.
+    
+    Args:
+        config: Configuration dictionary
+        state: Two-letter state code
+        config_dir: Directory to save config file (defaults to configs/ in project root)
+        fmt: File format, either 'json' or 'yaml'
+        
+    Returns:
+        Path to the written config file
+    """
+    if fmt not in ('json', 'yaml'):
+        raise ValueError(f"Unsupported config format: {fmt}")
+    
+    if config_dir is None:
+        config_dir = DEFAULT_CONFIG_DIR
     os.makedirs(config_dir, exist_ok=True)
     
-    config_path = os.path.join(config_dir, f'{state_code.lower()}_config.yaml')
-    with open(config_path, 'w') as f:
-        yaml.dump(config, f, default_flow_style=False)
+    config_file = os.path.join(config_dir, f'{state.lower()}_config.{fmt}')
+    if fmt == 'json' and orjson is not None:
+        # orjson encodes straight to UTF-8 bytes, much faster than json.dump with indent
+        with open(config_file, 'wb') as f:
+            f.write(orjson.dumps(config, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY))
+        return config_file
+    
+    with open(config_file, 'w') as f:
+        if fmt == 'yaml':
+            # Prefer the libyaml-backed dumper when PyYAML was built with it
+            yaml.dump(config, f, Dumper=getattr(yaml, 'CSafeDumper', yaml.SafeDumper), default_flow_style=False)
+        else:
+            json.dump(config, f, indent=2)
+    
+    return config_file
 
 def onboard_state(args: argparse.Namespace) -> None:
     """
@@ -306,49 +346,31 @@ def onboard_state(args: argparse.Namespace) -> None:
     Args:
         args: Command line arguments
     """
-    # Detect the delimiter
-    with open(args.file, 'r', encoding='windows-1252') as f:
-        first_line = f.readline()
-        if '|' in first_line:
-            delimiter = '|'
-        elif ',' in first_line:
-            delimiter = ','
-        else:
-            delimiter = ','  # Default to comma
-    
-    # Read sample of data file to analyze
-    df = pd.read_csv(args.file, nrows=1000, delimiter=delimiter, encoding='windows-1252')
-    
-    # Clean up column names by removing trailing whitespace
-    df.columns = [col.strip() for col in df.columns]
+    # Detect the file format and read column names from the header; only the
+    # names are analyzed, so no data rows need to be read or parsed
+    file_format, delimiter, column_names = detect_file_format(args.file)
     
-    # Get column names from the file
-    column_names = df.columns.tolist()
+    # Lowercase the column names once for both analyzers
+    col_lookup = {col.lower(): col for col in column_names}
     
     # Analyze columns and suggest mappings
-    mappings = analyze_columns(df)
+    mappings = analyze_columns(column_names, col_lookup)
     
     # Analyze address fields
-    address_fields = analyze_address_fields(df, column_names)
+    address_fields = analyze_address_fields(column_names, col_lookup)
     
     # Create config
     config = {
         'state_code': args.state,
-        'file_format': 'csv',
+        'file_format': file_format,
         'delimiter': delimiter,
         'column_mappings': mappings,
         'address_fields': address_fields,
         'column_names': column_names  # Add column names to config
     }
     
-    # Create config directory if it doesn't exist
-    config_dir = args.config_dir or os.path.join(os.path.dirname(__file__), '..', '..', '..', 'configs')
-    os.makedirs(config_dir, exist_ok=True)
-    
     # Write config file
-    config_file = os.path.join(config_dir, f'{args.state.lower()}_config.json')
-    with open(config_file, 'w') as f:
-        json.dump(config, f, indent=4)
+    config_file = _write_config(config, args.state, args.config_dir or None)
     
     print(f"Created config file: {config_file}")
 
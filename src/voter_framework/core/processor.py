@@ -2,7 +2,7 @@
 Core processor for handling voter registration data.
 """
 
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 from datetime import datetime
 import pandas as pd
 from ..adapters.base import BaseStateAdapter
@@ -47,12 +47,44 @@ class VoterDataProcessor:
         
         return normalized_data
     
+    def process_state_data_chunked(self, adapter: BaseStateAdapter, chunksize: int = 500_000) -> pd.DataFrame:
+        """
+        Process voter registration data for a specific state one chunk at a time.
+        
+        Raw chunks are normalized as they are fetched, so only one raw chunk is
+        held in memory alongside the normalized output.
+        
+        Args:
+            adapter: State-specific adapter instance
+            chunksize: Maximum number of raw rows fetched and normalized at once
+            
+        Returns:
+            DataFrame containing normalized voter data
+        """
+        # Get normalizer
+        normalizer = adapter.get_normalizer()
+        
+        # Normalize each raw chunk as soon as it is fetched
+        normalized_chunks = [normalizer.normalize(chunk) for chunk in adapter.fetch_data_iter(chunksize)]
+        normalized_data = pd.concat(normalized_chunks) if normalized_chunks else pd.DataFrame()
+        
+        # Store processed data
+        self.processed_data[adapter.state_code] = normalized_data
+        
+        # Calculate quality metrics
+        self.quality_metrics[adapter.state_code] = self._calculate_quality_metrics(normalized_data)
+        
+        return normalized_data
+    
     def _calculate_quality_metrics(self, data: pd.DataFrame) -> Dict:
         """Calculate data quality metrics for the processed dataset."""
+        # Frame-wide reductions for non-null and distinct counts of every column;
+        # each is a single call, unlike agg() which dispatches per column and function
+        total_records = len(data)
         metrics = {
-            'total_records': len(data),
-            'missing_values': data.isnull().sum().to_dict(),
-            'unique_values': {col: data[col].nunique() for col in data.columns},
+            'total_records': total_records,
+            'missing_values': (total_records - data.count()).to_dict(),
+            'unique_values': data.nunique(dropna=True).to_dict(),
             'data_types': data.dtypes.to_dict()
         }
         return metrics
@@ -101,10 +133,13 @@ class VoterDataProcessor:
         fields = {}
         for code in state_codes:
             df = self.processed_data[code]
+            # Reuse the dtypes and null counts recorded when the state was processed
+            # rather than scanning the frame again
+            metrics = self.quality_metrics.get(code) or self._calculate_quality_metrics(df)
             fields[code] = {
                 'columns': list(df.columns),
-                'dtypes': df.dtypes.to_dict(),
-                'null_counts': df.isnull().sum().to_dict()
+                'dtypes': dict(metrics['data_types']),
+                'null_counts': dict(metrics['missing_values'])
             }
         return fields
     
@@ -127,36 +162,53 @@ class VoterDataProcessor:
             'data_quality_metrics': {}
         }
         
+        # Compute each statistic for all columns in one call, instead of
+        # separate passes over every column
+        null_counts, null_total = self._null_stats(data)
+        unique_counts = data.nunique()
+        numeric_data = data.select_dtypes(include='number')
+        
+        # Reduce each dtype group on its own: one reduction over mixed int and
+        # float columns would upcast the integer min/max values to float
+        numeric_stats = {}
+        for columns in numeric_data.columns.groupby(numeric_data.dtypes).values():
+            block = numeric_data[columns]
+            block_stats = {'min': block.min(), 'max': block.max(), 'mean': block.mean(), 'median': block.median()}
+            for column in columns:
+                numeric_stats[column] = {name: values[column] for name, values in block_stats.items()}
+        
         # Calculate column statistics
         for column in data.columns:
             stats = {
-                'null_count': data[column].isnull().sum(),
-                'null_percentage': (data[column].isnull().sum() / len(data)) * 100,
-                'unique_values': data[column].nunique()
+                'null_count': null_counts[column],
+                'null_percentage': (null_counts[column] / len(data)) * 100,
+                'unique_values': unique_counts[column]
             }
             
-            if data[column].dtype in ['int64', 'float64']:
-                stats.update({
-                    'min': data[column].min(),
-                    'max': data[column].max(),
-                    'mean': data[column].mean(),
-                    'median': data[column].median()
-                })
+            if column in numeric_stats:
+                stats.update(numeric_stats[column])
             
             report['column_statistics'][column] = stats
         
         # Calculate data quality metrics
         report['data_quality_metrics'] = {
-            'completeness': self._calculate_completeness(data),
+            'completeness': self._calculate_completeness(data, null_total),
             'consistency': self._calculate_consistency(data),
             'validity': self._calculate_validity(data)
         }
         
         return report
     
-    def _calculate_completeness(self, data: pd.DataFrame) -> float:
+    def _null_stats(self, data: pd.DataFrame) -> Tuple[pd.Series, int]:
+        """Build the null mask once and return per-column and total null counts."""
+        per_column = data.isna().sum(axis=0)
+        return per_column, int(per_column.sum())
+    
+    def _calculate_completeness(self, data: pd.DataFrame, null_total: Optional[int] = None) -> float:
         """Calculate data completeness score."""
-        return 1 - (data.isnull().sum().sum() / (len(data) * len(data.columns)))
+        if null_total is None:
+            _, null_total = self._null_stats(data)
+        return 1 - (null_total / (len(data) * len(data.columns)))
     
     def _calculate_consistency(self, data: pd.DataFrame) -> float:
         """Calculate data consistency score."""
@@ -2,7 +2,7 @@
 Schema definitions for voter registration data.
 """
 
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 from dataclasses import dataclass
 from datetime import datetime
 
@@ -30,10 +30,11 @@ class VoterSchema:
     congressional_district: str = 'congressional_district'
     legislative_district: str = 'legislative_district'
     
+    # Field groupings are built on each access, so they follow reassigned field names
     @property
-    def required_fields(self) -> List[str]:
-        """Get list of required field names."""
-        return [
+    def required_fields(self) -> Tuple[str, ...]:
+        """Get tuple of required field names."""
+        return (
             self.first_name,
             self.last_name,
             self.birth_date,
@@ -42,12 +43,12 @@ class VoterSchema:
             self.city,
             self.state,
             self.zip_code
-        ]
+        )
     
     @property
-    def optional_fields(self) -> List[str]:
-        """Get list of optional field names."""
-        return [
+    def optional_fields(self) -> Tuple[str, ...]:
+        """Get tuple of optional field names."""
+        return (
             self.middle_name,
             self.suffix,
             self.gender,
@@ -56,11 +57,11 @@ class VoterSchema:
             self.county,
             self.congressional_district,
             self.legislative_district
-        ]
+        )
     
     @property
-    def all_fields(self) -> List[str]:
-        """Get list of all field names."""
+    def all_fields(self) -> Tuple[str, ...]:
+        """Get tuple of all field names."""
         return self.required_fields + self.optional_fields
     
     def get_field_type(self, field_name: str) -> str:
@@ -73,15 +74,13 @@ class VoterSchema:
         Returns:
             Expected data type as string
         """
-        date_fields = [self.birth_date, self.registration_date]
-        numeric_fields = [self.zip_code, self.precinct, self.congressional_district, self.legislative_district]
-        
-        if field_name in date_fields:
+        # Field names are read on each call, so reassigned names are honoured;
+        # date fields take precedence if a name is configured as both
+        if field_name in (self.birth_date, self.registration_date):
             return 'date'
-        elif field_name in numeric_fields:
+        if field_name in (self.zip_code, self.precinct, self.congressional_district, self.legislative_district):
             return 'numeric'
-        else:
-            return 'string'
+        return 'string'
     
     def compare_schemas(self, schema1_fields: List[str], schema2_fields: List[str]) -> Dict:
         """
@@ -94,28 +93,18 @@ class VoterSchema:
         Returns:
             Dictionary containing schema comparison results
         """
+        # Hash the field lists once so every membership test is O(1)
+        fields1 = frozenset(schema1_fields)
+        fields2 = frozenset(schema2_fields)
+        
         comparison = {
-            'missing_in_schema1': [],
-            'missing_in_schema2': [],
-            'common_fields': [],
-            'schema1_only': [],
-            'schema2_only': []
+            # Missing required fields, in required-field order
+            'missing_in_schema1': [field for field in self.required_fields if field not in fields1],
+            'missing_in_schema2': [field for field in self.required_fields if field not in fields2],
+            # Compare all fields
+            'common_fields': sorted(fields1 & fields2),
+            'schema1_only': sorted(fields1 - fields2),
+            'schema2_only': sorted(fields2 - fields1)
         }
         
-        # Find missing required fields
-        for field in self.required_fields:
-            if field not in schema1_fields:
-                comparison['missing_in_schema1'].append(field)
-            if field not in schema2_fields:
-                comparison['missing_in_schema2'].append(field)
-        
-        # Compare all fields
-        for field in set(schema1_fields + schema2_fields):
-            if field in schema1_fields and field in schema2_fields:
-                comparison['common_fields'].append(field)
-            elif field in schema1_fields:
-                comparison['schema1_only'].append(field)
-            else:
-                comparison['schema2_only'].append(field)
-        
-        return comparison 
\ No newline at end of file
+        return comparison
@@ -2,17 +2,49 @@
 Data validation utilities for voter registration data.
 """
 
+import copy
+import hashlib
+from collections import OrderedDict
 from typing import Dict, List, Optional
 import pandas as pd
 from datetime import datetime
 from .schema import VoterSchema
+from ..utils.dates import ISO_DATE_FORMAT, parse_dates
+from ..utils.zip_codes import valid_zip_mask
+
+# Two-letter postal codes of the states, DC and the inhabited territories
+US_STATE_CODES = frozenset({
+    'AL', 'AK', 'AZ', 'AR', 'CA', 'CO', 'CT', 'DE', 'FL', 'GA',
+    'HI', 'ID', 'IL', 'IN', 'IA', 'KS', 'KY', 'LA', 'ME', 'MD',
+    'MA', 'MI', 'MN', 'MS', 'MO', 'MT', 'NE', 'NV', 'NH', 'NJ',
+    'NM', 'NY', 'NC', 'ND', 'OH', 'OK', 'OR', 'PA', 'RI', 'SC',
+    'SD', 'TN', 'TX', 'UT', 'VT', 'VA', 'WA', 'WV', 'WI', 'WY',
+    'DC', 'AS', 'GU', 'MP', 'PR', 'VI'
+})
 
 class DataValidator:
     """Validator for voter registration data."""
     
-    def __init__(self):
-        """Initialize the validator with the voter schema."""
+    def __init__(self, cache_size: int = 0):
+        """
+        Initialize the validator with the voter schema.
+        
+        Args:
+            cache_size: Number of validate() results to keep, keyed by a hash of
+                the data's contents; 0 disables caching. Hashing costs roughly
+                half a validation, so enable it only when the same data is
+                validated repeatedly.
+        """
         self.schema = VoterSchema()
+        self.cache_size = cache_size
+        self._validation_cache: OrderedDict = OrderedDict()
+        
+        # Schema fields that need type parsing, mapped to 'date' or 'numeric'
+        self._typed_fields = {
+            field: self.schema.get_field_type(field)
+            for field in self.schema.all_fields
+            if self.schema.get_field_type(field) != 'string'
+        }
     
     def validate(self, data: pd.DataFrame) -> Dict:
         """
@@ -31,56 +63,208 @@ class DataValidator:
         }
         
         # Check required fields
+        self._check_required_fields(data.columns, validation)
+        
+        # The remaining checks scan values, so there is nothing to do without rows
+        if data.empty:
+            return validation
+        
+        cache_key = self._fingerprint(data) if self.cache_size > 0 else None
+        if cache_key is not None and cache_key in self._validation_cache:
+            self._validation_cache.move_to_end(cache_key)
+            return copy.deepcopy(self._validation_cache[cache_key])
+        
+        # Validate data types
+        validation['warnings'].extend(self._type_warnings(data).values())
+        
+        # Validate ZIP codes, state codes and names
+        validation['warnings'].extend(self._count_warnings(self._count_invalid_values(data)))
+        
+        if cache_key is not None:
+            self._validation_cache[cache_key] = copy.deepcopy(validation)
+            if len(self._validation_cache) > self.cache_size:
+                self._validation_cache.popitem(last=False)
+        
+        return validation
+    
+    def _fingerprint(self, data: pd.DataFrame) -> Optional[tuple]:
+        """
+        Build a cache key from the data's columns, dtypes and cell values.
+        
+        Args:
+            data: DataFrame containing voter data
+            
+        Returns:
+            Hashable key, or None if the values cannot be hashed
+        """
+        try:
+            row_hashes = pd.util.hash_pandas_object(data, index=False).to_numpy()
+        except TypeError:
+            return None
+        content_digest = hashlib.blake2b(row_hashes.tobytes(), digest_size=16).digest()
+        return tuple(data.columns), tuple(map(str, data.dtypes)), content_digest
+    
+    def validate_chunked(self, file_path: str, chunksize: int = 100_000, delimiter: str = ',') -> Dict:
+        """
+        Validate a voter registration file without loading it all at once.
+        
+        The file is read in chunks and per-chunk counts are summed, while only
+        one chunk is held in memory. Date layouts are tracked across chunks
+        (see _parse_date_chunk), so a date column whose layout changes between
+        chunks is reported as validate() would report it for the whole file.
+        Type warnings report the first failure per field, which may come from
+        a different row than validate() names.
+        
+        Args:
+            file_path: Path to the delimited voter file
+            chunksize: Number of rows read per chunk
+            delimiter: Field delimiter of the file
+            
+        Returns:
+            Dictionary containing validation results
+        """
+        validation = {
+            'is_valid': True,
+            'warnings': [],
+            'errors': []
+        }
+        
+        columns = []
+        type_warnings = {}
+        invalid_counts = {}
+        date_state = {}
+        with pd.read_csv(file_path, sep=delimiter, dtype=str, chunksize=chunksize) as reader:
+            for chunk in reader:
+                columns = chunk.columns
+                for field, warning in self._type_warnings(chunk, date_state).items():
+                    type_warnings.setdefault(field, warning)
+                for check, count in self._count_invalid_values(chunk).items():
+                    invalid_counts[check] = invalid_counts.get(check, 0) + count
+        
+        self._check_required_fields(columns, validation)
+        validation['warnings'].extend(type_warnings.values())
+        validation['warnings'].extend(self._count_warnings(invalid_counts))
+        
+        return validation
+    
+    @staticmethod
+    def _parse_date_chunk(values: pd.Series, date_state: Dict[str, list]) -> None:
+        """
+        Parse one chunk of a date column as parse_dates would parse the whole column.
+        
+        parse_dates tries the ISO layout on the whole column and otherwise lets
+        pandas infer the layout from the column's first value. For each field,
+        date_state keeps the first value in the file and whether every chunk so
+        far was ISO; once a chunk is not, this and later chunks are parsed
+        behind that first value so pandas infers the same layout.
+        
+        Args:
+            values: One chunk of a date column, with at least one value
+            date_state: Per-field [first value, all ISO so far], updated in place
+            
+        Raises:
+            ValueError: If the chunk does not parse under the column's layout
+        """
+        state = date_state.setdefault(values.name, [values.loc[values.first_valid_index()], True])
+        if state[1]:
+            try:
+                pd.to_datetime(values, format=ISO_DATE_FORMAT, cache=True)
+                return
+            except (ValueError, TypeError):
+                state[1] = False
+        pd.to_datetime(pd.concat([pd.Series([state[0]]), values], ignore_index=True))
+    
+    def _check_required_fields(self, columns, validation: Dict) -> None:
+        """Record an error if any required schema field is missing from the columns."""
         missing_fields = [field for field in self.schema.required_fields 
-                         if field not in data.columns]
+                         if field not in columns]
         if missing_fields:
             validation['is_valid'] = False
             validation['errors'].append(f"Missing required fields: {missing_fields}")
+    
+    def _type_warnings(self, data: pd.DataFrame, date_state: Optional[Dict[str, list]] = None) -> Dict[str, str]:
+        """
+        Map each date or numeric field that fails to parse to its warning.
         
-        # Validate data types
+        Args:
+            data: DataFrame containing voter data
+            date_state: Date layout state shared across the chunks of one file,
+                or None when data is the whole file
+            
+        Returns:
+            Dictionary mapping each failing field to its warning
+        """
+        warnings = {}
+        
+        # Columns that already have the expected dtype are valid by
+        # construction and are not parsed again; neither are columns with
+        # no values at all
         for field in data.columns:
-            field_type = self.schema.get_field_type(field)
+            field_type = self._typed_fields.get(field)
+            if field_type is None or data[field].isna().all():
+                continue
             if field_type == 'date':
+                if pd.api.types.is_datetime64_any_dtype(data[field]):
+                    continue
                 try:
-                    pd.to_datetime(data[field])
+                    if date_state is None:
+                        parse_dates(data[field])
+                    else:
+                        self._parse_date_chunk(data[field], date_state)
                 except Exception as e:
-                    validation['warnings'].append(
-                        f"Invalid date format in {field}: {str(e)}"
-                    )
+                    warnings[field] = f"Invalid date format in {field}: {str(e)}"
             elif field_type == 'numeric':
+                if pd.api.types.is_numeric_dtype(data[field]):
+                    continue
                 try:
                     pd.to_numeric(data[field], errors='raise')
                 except Exception as e:
-                    validation['warnings'].append(
-                        f"Invalid numeric format in {field}: {str(e)}"
-                    )
+                    warnings[field] = f"Invalid numeric format in {field}: {str(e)}"
+        
+        return warnings
+    
+    def _count_invalid_values(self, data: pd.DataFrame) -> Dict[str, int]:
+        """
+        Count invalid ZIP codes, invalid state codes and empty names.
+        
+        Counts are boolean mask sums, so no filtered copy of the rows is built.
+        
+        Args:
+            data: DataFrame containing voter data
+            
+        Returns:
+            Dictionary mapping each checked column to its number of bad values
+        """
+        counts = {}
         
         # Validate ZIP codes
         if 'zip_code' in data.columns:
-            invalid_zips = data[~data['zip_code'].str.match(r'^\d{5}(-\d{4})?$', na=False)]
-            if not invalid_zips.empty:
-                validation['warnings'].append(
-                    f"Found {len(invalid_zips)} invalid ZIP codes"
-                )
+            counts['zip_code'] = int((~valid_zip_mask(data['zip_code'])).sum())
         
         # Validate state codes
         if 'state' in data.columns:
-            invalid_states = data[~data['state'].str.match(r'^[A-Z]{2}$', na=False)]
-            if not invalid_states.empty:
-                validation['warnings'].append(
-                    f"Found {len(invalid_states)} invalid state codes"
-                )
+            counts['state'] = int((~data['state'].isin(US_STATE_CODES)).sum())
         
         # Validate names
         for field in ['first_name', 'last_name']:
             if field in data.columns:
-                empty_names = data[data[field].isna() | (data[field] == '')]
-                if not empty_names.empty:
-                    validation['warnings'].append(
-                        f"Found {len(empty_names)} empty {field}s"
-                    )
+                counts[field] = int((data[field].isna() | (data[field] == '')).sum())
         
-        return validation
+        return counts
+    
+    def _count_warnings(self, invalid_counts: Dict[str, int]) -> List[str]:
+        """Build warnings for the non-zero counts from _count_invalid_values."""
+        warnings = []
+        for field, count in invalid_counts.items():
+            if not count:
+                continue
+            if field == 'zip_code':
+                warnings.append(f"Found {count} invalid ZIP codes")
+            elif field == 'state':
+                warnings.append(f"Found {count} invalid state codes")
+            else:
+                warnings.append(f"Found {count} empty {field}s")
+        return warnings
     
     def validate_address(self, address_data: pd.DataFrame) -> Dict:
         """
@@ -108,18 +292,18 @@ class DataValidator:
         
         # Validate ZIP codes
         if 'zip_code' in address_data.columns:
-            invalid_zips = address_data[~address_data['zip_code'].str.match(r'^\d{5}(-\d{4})?$', na=False)]
-            if not invalid_zips.empty:
+            invalid_zip_count = int((~valid_zip_mask(address_data['zip_code'])).sum())
+            if invalid_zip_count:
                 validation['warnings'].append(
-                    f"Found {len(invalid_zips)} invalid ZIP codes"
+                    f"Found {invalid_zip_count} invalid ZIP codes"
                 )
         
         # Validate state codes
         if 'state' in address_data.columns:
-            invalid_states = address_data[~address_data['state'].str.match(r'^[A-Z]{2}$', na=False)]
-            if not invalid_states.empty:
+            invalid_state_count = int((~address_data['state'].isin(US_STATE_CODES)).sum())
+            if invalid_state_count:
                 validation['warnings'].append(
-                    f"Found {len(invalid_states)} invalid state codes"
+                    f"Found {invalid_state_count} invalid state codes"
                 )
         
         return validation 
\ No newline at end of file
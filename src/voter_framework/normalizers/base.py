@@ -3,25 +3,45 @@ Base normalizer for voter registration data.
 """
 
 from abc import ABC, abstractmethod
+import numpy as np
 import pandas as pd
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 from datetime import datetime
+from ..utils.dates import ISO_DATE_FORMAT, parse_dates
+from ..utils.zip_codes import valid_zip_mask
+
+# ASCII bytes clean_name drops: everything except lowercase letters, digits,
+# spaces and hyphens (names are lowercased before filtering)
+_NAME_DELETE_BYTES = bytes(
+    b for b in range(128)
+    if not (chr(b).islower() or chr(b).isdigit() or chr(b) in ' -')
+)
+
+# Date layouts accepted in raw voter data, keyed by (separator, starts with a
+# four-digit year); a date string can only match the one layout its shape
+# selects
+_DATE_FORMAT_BY_LAYOUT = {
+    ('-', True): ISO_DATE_FORMAT,
+    ('/', False): '%m/%d/%Y',
+    ('-', False): '%m-%d-%Y',
+    ('/', True): '%Y/%m/%d'
+}
 
 class BaseDataNormalizer(ABC):
     """Abstract base class for normalizing voter registration data."""
     
-    def __init__(self):
-        """Initialize the normalizer."""
-        self.required_fields = [
-            'first_name',
-            'last_name',
-            'birth_date',
-            'registration_date',
-            'address',
-            'city',
-            'state',
-            'zip_code'
-        ]
+    # Fields every normalized frame must contain, in reporting order; shared
+    # by all instances rather than rebuilt per normalizer
+    required_fields: Tuple[str, ...] = (
+        'first_name',
+        'last_name',
+        'birth_date',
+        'registration_date',
+        'address',
+        'city',
+        'state',
+        'zip_code'
+    )
     
     @abstractmethod
     def normalize(self, data: pd.DataFrame) -> pd.DataFrame:
@@ -54,31 +74,31 @@ class BaseDataNormalizer(ABC):
         }
         
         # Check required fields
-        for field in self.required_fields:
-            if field not in data.columns:
-                validation['is_valid'] = False
-                validation['missing_fields'].append(field)
+        validation['missing_fields'] = [field for field in self.required_fields
+                                        if field not in data.columns]
+        if validation['missing_fields']:
+            validation['is_valid'] = False
         
-        # Validate data types
-        if 'birth_date' in data.columns:
+        # Validate data types; datetime columns need no parsing
+        if 'birth_date' in data.columns and not pd.api.types.is_datetime64_any_dtype(data['birth_date']):
             try:
-                pd.to_datetime(data['birth_date'])
+                parse_dates(data['birth_date'])
             except Exception:
                 validation['is_valid'] = False
                 validation['invalid_types'].append('birth_date')
         
-        if 'registration_date' in data.columns:
+        if 'registration_date' in data.columns and not pd.api.types.is_datetime64_any_dtype(data['registration_date']):
             try:
-                pd.to_datetime(data['registration_date'])
+                parse_dates(data['registration_date'])
             except Exception:
                 validation['is_valid'] = False
                 validation['invalid_types'].append('registration_date')
         
         # Validate ZIP codes
         if 'zip_code' in data.columns:
-            invalid_zips = data[~data['zip_code'].str.match(r'^\d{5}(-\d{4})?$', na=False)]
-            if not invalid_zips.empty:
-                validation['warnings'].append(f'Found {len(invalid_zips)} invalid ZIP codes')
+            invalid_zip_count = int((~valid_zip_mask(data['zip_code'])).sum())
+            if invalid_zip_count:
+                validation['warnings'].append(f'Found {invalid_zip_count} invalid ZIP codes')
         
         return validation
     
@@ -98,11 +118,35 @@ class BaseDataNormalizer(ABC):
         # Convert to lowercase and remove extra whitespace
         name = ' '.join(name.lower().split())
         
-        # Remove special characters except spaces and hyphens
-        name = ''.join(c for c in name if c.isalnum() or c in [' ', '-'])
+        # Remove special characters except spaces and hyphens; ASCII names are
+        # filtered with a single bytes.translate instead of a per-character test
+        if name.isascii():
+            name = name.encode('ascii').translate(None, _NAME_DELETE_BYTES).decode('ascii')
+        else:
+            name = ''.join(c for c in name if c.isalnum() or c in [' ', '-'])
         
         return name
     
+    def clean_names(self, names: pd.Series) -> pd.Series:
+        """
+        Clean and standardize a column of names; column form of clean_name.
+        
+        Voter files repeat the same first and last names many times, so each
+        distinct name is cleaned once and the results are mapped back.
+        
+        Args:
+            names: Series of raw name strings
+            
+        Returns:
+            Series of cleaned name strings, with missing values as ''
+        """
+        codes, uniques = pd.factorize(names)
+        
+        # Missing values have code -1, which picks the trailing ''
+        cleaned = np.array([self.clean_name(name) for name in uniques] + [''], dtype=object)
+        
+        return pd.Series(cleaned[codes], index=names.index, name=names.name)
+    
     def standardize_date(self, date_str: str) -> Optional[str]:
         """
         Standardize date string to ISO format.
@@ -117,13 +161,55 @@ class BaseDataNormalizer(ABC):
             return None
         
         try:
-            # Try various date formats
-            for fmt in ['%Y-%m-%d', '%m/%d/%Y', '%m-%d-%Y', '%Y/%m/%d']:
-                try:
-                    date = datetime.strptime(str(date_str), fmt)
-                    return date.strftime('%Y-%m-%d')
-                except ValueError:
-                    continue
-            return None
+            # Pick the one candidate format from the separator and year position
+            # rather than trying each format until one stops raising
+            date_str = str(date_str)
+            separator = '/' if '/' in date_str else '-'
+            fmt = _DATE_FORMAT_BY_LAYOUT[(separator, date_str[:4].isdigit())]
+            try:
+                date = datetime.strptime(date_str, fmt)
+                return date.strftime(ISO_DATE_FORMAT)
+            except ValueError:
+                return None
         except Exception:
-            return None 
\ No newline at end of file
+            return None
+    
+    def standardize_dates(self, dates: pd.Series) -> pd.Series:
+        """
+        Standardize a column of date strings to ISO format; column form of standardize_date.
+        
+        Rows are grouped by the layout their shape selects, exactly as
+        standardize_date chooses it, and each group is parsed with one
+        vectorized call.
+        
+        Args:
+            dates: Series of raw date strings
+            
+        Returns:
+            Series of ISO format date strings, None where invalid
+        """
+        if pd.api.types.infer_dtype(dates, skipna=True) not in ('string', 'empty'):
+            # Non-string values are formatted with str() by standardize_date
+            return dates.map(self.standardize_date).astype(object)
+        
+        present = dates.notna()
+        has_slash = dates.str.contains('/', regex=False)
+        year_first = dates.str[:4].str.isdigit()
+        
+        standardized = pd.Series([None] * len(dates), index=dates.index, dtype=object)
+        for (separator, starts_with_year), fmt in _DATE_FORMAT_BY_LAYOUT.items():
+            rows = present & (has_slash == (separator == '/')) & (year_first == starts_with_year)
+            if rows.any():
+                parsed = pd.to_datetime(dates[rows], format=fmt, errors='coerce', cache=True)
+                # pandas 3 accepts year 0, which strptime rejects; leave those
+                # rows to the scalar fallback below
+                parsed = parsed.where(parsed.dt.year >= 1)
+                standardized[rows] = parsed.dt.strftime(ISO_DATE_FORMAT).astype(object)
+        
+        # Rows their layout did not parse (invalid, or outside the datetime64
+        # range on older pandas) get the scalar parser's answer
+        unmatched = present & standardized.isna()
+        if unmatched.any():
+            standardized[unmatched] = dates[unmatched].map(self.standardize_date)
+        
+        return standardized
@@ -0,0 +1,30 @@
+"""
+Date parsing helpers for voter registration data.
+"""
+
+import pandas as pd
+
+# Date layout used by normalized voter data
+ISO_DATE_FORMAT = '%Y-%m-%d'
+
+def parse_dates(values: pd.Series) -> pd.Series:
+    """
+    Parse a column of date strings, trying the ISO layout first.
+    
+    An explicit format keeps pandas on its vectorized parser instead of
+    guessing a format (or, on older pandas, parsing row by row with dateutil).
+    Columns in any other layout fall back to pandas' own inference.
+    
+    Args:
+        values: Series of date values
+        
+    Returns:
+        Series of datetime64 values
+        
+    Raises:
+        ValueError: If the values cannot be parsed as dates
+    """
+    try:
+        return pd.to_datetime(values, format=ISO_DATE_FORMAT, cache=True)
+    except (ValueError, TypeError):
+        return pd.to_datetime(values)
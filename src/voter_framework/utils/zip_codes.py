@@ -0,0 +1,63 @@
+"""
+ZIP code validation helpers for voter registration data.
+"""
+
+import re
+import numpy as np
+import pandas as pd
+
+# Five-digit ZIP or ZIP+4, used for columns that are not purely strings
+_ZIP_CODE_REGEX = re.compile(r'^\d{5}(-\d{4})?$')
+
+# Width of the fixed-size string view: the longest valid code
+_ZIP_VIEW_WIDTH = 10
+
+def _is_arrow_backed(dtype) -> bool:
+    """Return True for pyarrow-backed string or Arrow extension dtypes."""
+    arrow_dtype = getattr(pd, 'ArrowDtype', None)
+    if arrow_dtype is not None and isinstance(dtype, arrow_dtype):
+        return True
+    return isinstance(dtype, pd.StringDtype) and str(dtype.storage).startswith('pyarrow')
+
+def valid_zip_mask(zip_codes: pd.Series) -> np.ndarray:
+    """
+    Flag values that are a five-digit ZIP or a ZIP+4 code.
+    
+    String columns are checked by comparing character codes on a fixed-width
+    array instead of running the regex per value; Arrow-backed columns use
+    Arrow's regex kernel. Only ASCII digits count.
+    
+    Args:
+        zip_codes: Series of ZIP code values
+        
+    Returns:
+        Boolean array, False for invalid or missing values
+    """
+    if _is_arrow_backed(zip_codes.dtype):
+        # Arrow string buffers are matched in place by Arrow's regex kernel
+        # (RE2, where \d is ASCII-only); pyarrow is necessarily installed here
+        import pyarrow as pa
+        import pyarrow.compute as pc
+        values = pa.array(zip_codes.array)
+        if pa.types.is_string(values.type) or pa.types.is_large_string(values.type):
+            matches = pc.match_substring_regex(values, _ZIP_CODE_REGEX.pattern)
+            return np.asarray(matches.fill_null(False), dtype=bool)
+    
+    if pd.api.types.infer_dtype(zip_codes, skipna=True) not in ('string', 'empty'):
+        # Mixed or non-string values: non-strings are treated as invalid
+        return zip_codes.str.match(_ZIP_CODE_REGEX, na=False).to_numpy(dtype=bool)
+    
+    # Missing values become empty strings, which fail the digit check
+    values = zip_codes.to_numpy(dtype=object, na_value='').astype(f'U{_ZIP_VIEW_WIDTH}')
+    codes = values.view(np.uint32).reshape(len(values), _ZIP_VIEW_WIDTH)
+    is_digit = (codes >= ord('0')) & (codes <= ord('9'))
+    
+    # The view reads a NUL code point as the end of the string and truncates
+    # longer values, so the real length is checked separately
+    lengths = zip_codes.str.len().fillna(0).to_numpy(dtype=np.int64)
+    
+    # Five digits, or five digits, '-' and four digits
+    head = is_digit[:, :5].all(axis=1)
+    five_digit = head & (lengths == 5)
+    zip_plus_four = head & (lengths == 10) & (codes[:, 5] == ord('-')) & is_digit[:, 6:10].all(axis=1)
+    return five_digit | zip_plus_four
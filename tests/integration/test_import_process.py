@@ -8,8 +8,6 @@ import pandas as pd
 import os
 import sys
 import sqlite3
-import tempfile
-import shutil
 import time
 
 # Add the src directory to the path
@@ -24,6 +22,7 @@ from src.voter_framework.cli.onboard_state import (
 from src.voter_framework.cli.import_to_sqlite import (
     create_table,
     import_data,
+    join_address_parts,
     get_table_name,
     read_data_file
 )
@@ -31,31 +30,38 @@ from src.voter_framework.cli.import_to_sqlite import (
 class TestImportProcess(unittest.TestCase):
     """Integration tests for the full import process."""
 
+    @classmethod
+    def setUpClass(cls):
+        """Parse the fixture files once for the whole class."""
+        # Set up paths to test fixtures
+        cls.fixtures_dir = os.path.join(os.path.dirname(__file__), '../fixtures')
+        cls.wa_file_path = os.path.join(cls.fixtures_dir, 'wa_test_data.csv')
+        cls.or_file_path = os.path.join(cls.fixtures_dir, 'or_test_data.csv')
+        cls.ca_file_path = os.path.join(cls.fixtures_dir, 'ca_test_data.csv')
+        
+        # Detect format, read the data and build the state config for each
+        # fixture; import_data only reads these, so the tests share them
+        cls.or_df, cls.or_config = cls._load_fixture('OR', cls.or_file_path)
+        cls.ca_df, cls.ca_config = cls._load_fixture('CA', cls.ca_file_path)
+    
+    @staticmethod
+    def _load_fixture(state_code, file_path):
+        """Read a fixture file and build its state config."""
+        file_format, delimiter, columns = detect_file_format(file_path)
+        df = pd.read_csv(file_path, sep=delimiter, header=0, dtype=str)
+        mappings = analyze_columns(columns)
+        config = create_state_config(state_code, file_path, mappings, columns)
+        return df, config
+
     def setUp(self):
         """Set up test fixtures."""
-        # Create a temporary directory for test configs
-        self.temp_dir = tempfile.mkdtemp()
-        self.config_dir = os.path.join(self.temp_dir, 'config')
-        os.makedirs(self.config_dir, exist_ok=True)
-        
-        # Set up paths to test fixtures
-        self.fixtures_dir = os.path.join(os.path.dirname(__file__), '../fixtures')
-        self.wa_file_path = os.path.join(self.fixtures_dir, 'wa_test_data.csv')
-        self.or_file_path = os.path.join(self.fixtures_dir, 'or_test_data.csv')
-        self.ca_file_path = os.path.join(self.fixtures_dir, 'ca_test_data.csv')
-        
-        # Create a temporary SQLite database
-        self.db_path = os.path.join(self.temp_dir, 'test_voter_data.db')
-        self.conn = sqlite3.connect(self.db_path)
+        # Each test gets its own in-memory SQLite database
+        self.conn = sqlite3.connect(':memory:')
 
     def tearDown(self):
         """Clean up test fixtures."""
         # Close the database connection
-        if hasattr(self, 'conn') and self.conn:
-            self.conn.close()
-        
-        # Remove temporary directory
-        shutil.rmtree(self.temp_dir)
+        self.conn.close()
 
     def test_wa_import_process(self):
         """Test the full import process for Washington format."""
@@ -141,20 +147,30 @@ class TestImportProcess(unittest.TestCase):
         self.assertEqual(row[0], '123')
         self.assertEqual(row[1], 'Main')
         self.assertEqual(row[2], 'St')
-    
-    def test_or_import_process(self):
-        """Test the full import process for Oregon format."""
-        # First, detect format and read columns
-        or_format, or_delimiter, or_columns = detect_file_format(self.or_file_path)
         
-        # Read the data
-        or_df = pd.read_csv(self.or_file_path, sep=or_delimiter, header=0, dtype=str)
+        # Check combined address
+        cursor.execute(f"SELECT address FROM {table_name} LIMIT 1")
+        self.assertEqual(cursor.fetchone()[0], '123 1/2 N Main St Apt W 4B')
+    
+    def test_join_address_parts_skips_blank_components(self):
+        """Test that blank and missing address components are left out of the join."""
+        parts = [
+            pd.Series(['123', '', '7']),
+            pd.Series(['N', ' ', None]).fillna(''),
+            pd.Series(['Main', 'Oak', ''])
+        ]
         
-        # Generate column mappings
-        mappings = analyze_columns(or_df)
+        self.assertEqual(join_address_parts(parts, ' ').tolist(), ['123 N Main', 'Oak', '7'])
+    
+    def test_new_config_timestamps_match(self):
+        """Test that a newly created config has equal created and updated timestamps."""
+        config = self.or_config
         
-        # Create state config
-        config = create_state_config('OR', self.or_file_path, mappings, or_df, or_columns)
+        self.assertEqual(config['created_at'], config['last_updated'])
+    
+    def test_or_import_process(self):
+        """Test the full import process for Oregon format."""
+        config = self.or_config
         
         # Get a unique table name using timestamp
         table_name = f"test_or_import_{int(time.time())}"
@@ -163,7 +179,7 @@ class TestImportProcess(unittest.TestCase):
         create_table(self.conn, table_name)
         
         # Import the data
-        import_data(self.conn, table_name, or_df, config['column_mappings'], config['address_fields'])
+        import_data(self.conn, table_name, self.or_df, config['column_mappings'], config['address_fields'])
         
         # Verify the import
         cursor = self.conn.cursor()
@@ -175,17 +191,7 @@ class TestImportProcess(unittest.TestCase):
     
     def test_ca_import_process(self):
         """Test the full import process for California format."""
-        # First, detect format and read columns
-        ca_format, ca_delimiter, ca_columns = detect_file_format(self.ca_file_path)
-        
-        # Read the data
-        ca_df = pd.read_csv(self.ca_file_path, sep=ca_delimiter, header=0, dtype=str)
-        
-        # Generate column mappings
-        mappings = analyze_columns(ca_df)
-        
-        # Create state config
-        config = create_state_config('CA', self.ca_file_path, mappings, ca_df, ca_columns)
+        config = self.ca_config
         
         # Get a unique table name using timestamp
         table_name = f"test_ca_import_{int(time.time())}"
@@ -194,7 +200,7 @@ class TestImportProcess(unittest.TestCase):
         create_table(self.conn, table_name)
         
         # Import the data
-        import_data(self.conn, table_name, ca_df, config['column_mappings'], config['address_fields'])
+        import_data(self.conn, table_name, self.ca_df, config['column_mappings'], config['address_fields'])
         
         # Verify the import
         cursor = self.conn.cursor()
@@ -203,6 +209,104 @@ class TestImportProcess(unittest.TestCase):
         cursor.execute(f"SELECT COUNT(*) FROM {table_name}")
         row_count = cursor.fetchone()[0]
         self.assertEqual(row_count, 5, "Expected 5 rows in the California test data")
+    
+    def test_reimport_reports_unique_violations(self):
+        """Test that re-importing the same voters exits and keeps the first import."""
+        config = self.or_config
+        table_name = f"test_or_reimport_{int(time.time())}"
+        
+        import_data(self.conn, table_name, self.or_df, config['column_mappings'], config['address_fields'])
+        
+        # Importing the same file again violates the voter_id UNIQUE constraint
+        with self.assertRaises(SystemExit):
+            import_data(self.conn, table_name, self.or_df, config['column_mappings'], config['address_fields'])
+        
+        # The first import is committed and the failed one left nothing behind
+        self.assertFalse(self.conn.in_transaction)
+        row_count = self.conn.execute(f"SELECT COUNT(*) FROM {table_name}").fetchone()[0]
+        self.assertEqual(row_count, 5)
+
+    def test_import_datetime_column(self):
+        """Test that datetime columns are stored as text and missing dates as NULL."""
+        table_name = f"test_dates_import_{int(time.time())}"
+        df = pd.DataFrame({
+            'voterid': ['V1', 'V2'],
+            'regdate': pd.to_datetime(['2020-01-01', None])
+        })
+        
+        import_data(self.conn, table_name, df, {'voterid': 'voter_id', 'regdate': 'registration_date'}, {})
+        
+        rows = self.conn.execute(f"SELECT voter_id, registration_date FROM {table_name} ORDER BY id").fetchall()
+        self.assertEqual(rows, [('V1', '2020-01-01 00:00:00'), ('V2', None)])
+    
+    def test_import_quotes_identifiers(self):
+        """Test that table and column names that need quoting are imported."""
+        table_name = 'test-quoted import'
+        self.conn.execute(f"""
+            CREATE TABLE "{table_name}" (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                voter_id TEXT UNIQUE, "order" TEXT, "first name" TEXT,
+                address TEXT, city TEXT, zip_code TEXT
+            )
+        """)
+        df = pd.DataFrame({'voterid': ['V1'], 'seq': ['7'], 'fname': ['Ann']})
+        mappings = {'voterid': 'voter_id', 'seq': 'order', 'fname': 'first name'}
+        
+        import_data(self.conn, table_name, df, mappings, {})
+        
+        rows = self.conn.execute(f'SELECT voter_id, "order", "first name" FROM "{table_name}"').fetchall()
+        self.assertEqual(rows, [('V1', '7', 'Ann')])
+    
+    def test_import_without_mapped_columns(self):
+        """Test that a file with no mapped columns inserts nothing."""
+        table_name = f"test_unmapped_import_{int(time.time())}"
+        
+        import_data(self.conn, table_name, pd.DataFrame({'unknown': ['x']}), {}, {})
+        
+        row_count = self.conn.execute(f"SELECT COUNT(*) FROM {table_name}").fetchone()[0]
+        self.assertEqual(row_count, 0)
+    
+    def _add_reject_trigger(self, table_name):
+        """Make the table reject rows whose voter_id is 'BAD'."""
+        self.conn.execute(f"""
+            CREATE TRIGGER reject_bad_row BEFORE INSERT ON {table_name}
+            WHEN NEW.voter_id = 'BAD'
+            BEGIN SELECT RAISE(ABORT, 'rejected row'); END
+        """)
+    
+    def test_failed_chunk_rolls_back_import(self):
+        """Test that a non-UNIQUE error rolls back the whole import and re-raises."""
+        table_name = f"test_failed_chunk_{int(time.time())}"
+        create_table(self.conn, table_name)
+        self._add_reject_trigger(table_name)
+        
+        # Reject one row in the second 10k-row chunk
+        df = pd.DataFrame({'voterid': [f'V{i}' for i in range(10000)] + ['BAD']})
+        
+        with self.assertRaises(sqlite3.IntegrityError):
+            import_data(self.conn, table_name, df, {'voterid': 'voter_id'}, {})
+        
+        self.assertFalse(self.conn.in_transaction)
+        row_count = self.conn.execute(f"SELECT COUNT(*) FROM {table_name}").fetchone()[0]
+        self.assertEqual(row_count, 0)
+    
+    def test_import_leaves_caller_transaction_open(self):
+        """Test that a transaction opened by the caller is neither committed nor rolled back."""
+        table_name = f"test_caller_transaction_{int(time.time())}"
+        create_table(self.conn, table_name)
+        self._add_reject_trigger(table_name)
+        
+        self.conn.execute("BEGIN")
+        import_data(self.conn, table_name, pd.DataFrame({'voterid': ['V1']}), {'voterid': 'voter_id'}, {})
+        self.assertTrue(self.conn.in_transaction)
+        
+        with self.assertRaises(sqlite3.IntegrityError):
+            import_data(self.conn, table_name, pd.DataFrame({'voterid': ['BAD']}), {'voterid': 'voter_id'}, {})
+        self.assertTrue(self.conn.in_transaction)
+        
+        self.conn.rollback()
+        row_count = self.conn.execute(f"SELECT COUNT(*) FROM {table_name}").fetchone()[0]
+        self.assertEqual(row_count, 0)
 
 if __name__ == '__main__':
     unittest.main() 
\ No newline at end of file
@@ -25,31 +25,37 @@ from src.voter_framework.cli.onboard_state import onboard_state
 class TestImportWorkflow(unittest.TestCase):
     """Integration tests for the full voter data import workflow."""
     
-    def setUp(self):
-        """Set up the test environment."""
+    @classmethod
+    def setUpClass(cls):
+        """Set up the temporary directory and fixture paths once for the class."""
         # Create a temporary directory for test output
-        self.test_dir = tempfile.mkdtemp()
-        self.db_path = os.path.join(self.test_dir, 'test_voters.db')
-        
-        # Store original arguments to restore later
-        self.original_args = sys.argv.copy()
+        cls.test_dir = tempfile.mkdtemp()
         
         # Get fixtures directory
-        self.fixtures_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), '../fixtures'))
+        cls.fixtures_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), '../fixtures'))
         
         # Define files for each state
-        self.wa_file = os.path.join(self.fixtures_dir, 'wa_test_data.csv')
-        self.or_file = os.path.join(self.fixtures_dir, 'or_test_data.csv')
-        self.ca_file = os.path.join(self.fixtures_dir, 'ca_test_data.csv')
+        cls.wa_file = os.path.join(cls.fixtures_dir, 'wa_test_data.csv')
+        cls.or_file = os.path.join(cls.fixtures_dir, 'or_test_data.csv')
+        cls.ca_file = os.path.join(cls.fixtures_dir, 'ca_test_data.csv')
+    
+    @classmethod
+    def tearDownClass(cls):
+        """Remove the temporary directory."""
+        shutil.rmtree(cls.test_dir, ignore_errors=True)
+    
+    def setUp(self):
+        """Set up the test environment."""
+        # Each test imports into its own database file
+        self.db_path = os.path.join(self.test_dir, f'{self._testMethodName}.db')
+        
+        # Store original arguments to restore later
+        self.original_args = sys.argv.copy()
         
     def tearDown(self):
         """Clean up after each test."""
         # Restore original arguments
         sys.argv = self.original_args
-        
-        # Clean up temporary directory
-        if os.path.exists(self.test_dir):
-            shutil.rmtree(self.test_dir)
     
     def test_wa_import_workflow(self):
         """Test the full Washington import workflow."""
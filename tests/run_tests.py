@@ -2,69 +2,85 @@
 """
 Test runner for voter registration framework tests.
 Discovers and runs all tests in the tests directory.
+
+Set TEST_VERBOSITY=2 to list every test as it runs.
 """
 
 import os
 import sys
 import unittest
-import datetime
+import time
+import importlib.util
+
+# Directories this module has put on sys.path
+_PATHS_ADDED = set()
+
+def _ensure_path(path: str) -> None:
+    """Put a directory at the front of sys.path once per process."""
+    if path not in _PATHS_ADDED:
+        if path not in sys.path:
+            sys.path.insert(0, path)
+        _PATHS_ADDED.add(path)
+
+class _DefiningModuleLoader(unittest.TestLoader):
+    """Test loader that only collects TestCase classes where they are defined."""
+    
+    def loadTestsFromModule(self, module, *, pattern=None):
+        """
+        Load the TestCase classes defined in a test module.
+        
+        Classes a module imports from elsewhere (such as a shared base
+        TestCase) are skipped, so they only run once, from the module that
+        defines them. Modules with a load_tests hook are left to the base
+        loader.
+        
+        Args:
+            module: Imported test module
+            pattern: Discovery pattern, passed on to load_tests hooks
+            
+        Returns:
+            Suite of the module's tests
+        """
+        if hasattr(module, 'load_tests'):
+            return super().loadTestsFromModule(module, pattern=pattern)
+        
+        suite = self.suiteClass()
+        for test_case in vars(module).values():
+            if (isinstance(test_case, type) and issubclass(test_case, unittest.TestCase)
+                    and test_case.__module__ == module.__name__):
+                suite.addTests(self.loadTestsFromTestCase(test_case))
+        return suite
 
 def run_tests():
     """
     Run all tests for the voter registration framework.
     """
-    start_time = datetime.datetime.now()
+    start_ns = time.perf_counter_ns()
     
     # Add the parent directory to the path so imports work correctly
     base_dir = os.path.dirname(os.path.abspath(__file__))
     parent_dir = os.path.dirname(base_dir)
-    if parent_dir not in sys.path:
-        sys.path.insert(0, parent_dir)
-    
-    # Run all tests in the unit and integration directories
-    unit_dir = os.path.join(base_dir, 'unit')
-    integration_dir = os.path.join(base_dir, 'integration')
+    _ensure_path(parent_dir)
     
     test_suite = unittest.TestSuite()
+    loader = _DefiningModuleLoader()
     
-    # Manually load the tests to avoid unittest discovery path issues
-    if os.path.exists(unit_dir):
-        print(f"Loading tests from {unit_dir}")
-        for file in os.listdir(unit_dir):
-            if file.startswith('test_') and file.endswith('.py'):
-                module_name = f"tests.unit.{file[:-3]}"
-                try:
-                    module = __import__(module_name, fromlist=['*'])
-                    for item in dir(module):
-                        if item.startswith('Test'):
-                            test_case = getattr(module, item)
-                            if isinstance(test_case, type) and issubclass(test_case, unittest.TestCase):
-                                test_suite.addTest(unittest.makeSuite(test_case))
-                except ImportError as e:
-                    print(f"Error importing {module_name}: {e}")
+    # Run all tests in the unit and integration directories; the project
+    # root is the top-level directory, so modules import as tests.unit.*
+    for subdir in ('unit', 'integration'):
+        test_dir = os.path.join(base_dir, subdir)
+        if os.path.isdir(test_dir):
+            print(f"Loading tests from {test_dir}")
+            test_suite.addTests(loader.discover(test_dir, pattern='test_*.py', top_level_dir=parent_dir))
     
-    if os.path.exists(integration_dir):
-        print(f"Loading tests from {integration_dir}")
-        for file in os.listdir(integration_dir):
-            if file.startswith('test_') and file.endswith('.py'):
-                module_name = f"tests.integration.{file[:-3]}"
-                try:
-                    module = __import__(module_name, fromlist=['*'])
-                    for item in dir(module):
-                        if item.startswith('Test'):
-                            test_case = getattr(module, item)
-                            if isinstance(test_case, type) and issubclass(test_case, unittest.TestCase):
-                                test_suite.addTest(unittest.makeSuite(test_case))
-                except ImportError as e:
-                    print(f"Error importing {module_name}: {e}")
-    
-    # Run the tests
-    runner = unittest.TextTestRunner(verbosity=2)
+    # Run the tests; output printed by passing tests is buffered and dropped,
+    # and per-test lines are only written when TEST_VERBOSITY is 2 or more
+    verbosity = int(os.environ.get('TEST_VERBOSITY', '1'))
+    runner = unittest.TextTestRunner(verbosity=verbosity, buffer=True)
     result = runner.run(test_suite)
     
     # Calculate elapsed time
-    end_time = datetime.datetime.now()
-    elapsed_time = (end_time - start_time).total_seconds()
+    elapsed_time = (time.perf_counter_ns() - start_ns) / 1e9
     
     # Print summary
     print("\n=== TEST RESULTS ===")
@@ -73,22 +89,48 @@ def run_tests():
     print(f"Failures: {len(result.failures)}")
     print(f"Skipped: {len(result.skipped)}")
     
-    # Print errors
-    if result.errors:
-        print("\n=== ERRORS ===")
-        for test, error in result.errors:
-            print(f"\n{test}")
-            print(f"{error}")
-    
-    # Print failures
-    if result.failures:
-        print("\n=== FAILURES ===")
-        for test, failure in result.failures:
-            print(f"\n{test}")
-            print(f"{failure}")
+    if not result.wasSuccessful():
+        # Print errors
+        if result.errors:
+            print("\n=== ERRORS ===")
+            for test, error in result.errors:
+                print(f"\n{test}")
+                print(f"{error}")
+        
+        # Print failures
+        if result.failures:
+            print("\n=== FAILURES ===")
+            for test, failure in result.failures:
+                print(f"\n{test}")
+                print(f"{failure}")
     
     return result
 
+def run_tests_parallel(workers: int = None) -> int:
+    """
+    Run all tests across worker processes with pytest-xdist.
+    
+    Test files are kept whole on one worker (--dist=loadfile), so tests that
+    share files on disk, such as the duplicate import test, never run at the
+    same time.
+    
+    Args:
+        workers: Number of worker processes (defaults to all but two CPUs)
+        
+    Returns:
+        pytest exit code (0 when every test passed)
+    """
+    import pytest
+    
+    base_dir = os.path.dirname(os.path.abspath(__file__))
+    if workers is None:
+        workers = max(1, (os.cpu_count() or 1) - 2)
+    return int(pytest.main(['-n', str(workers), '--dist=loadfile', base_dir]))
+
 if __name__ == "__main__":
+    if '--parallel' in sys.argv[1:]:
+        if importlib.util.find_spec('xdist') is not None:
+            sys.exit(run_tests_parallel())
+        print("pytest-xdist is not installed; running tests serially")
     result = run_tests()
     sys.exit(not result.wasSuccessful()) 
\ No newline at end of file
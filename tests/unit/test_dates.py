@@ -0,0 +1,35 @@
+#!/usr/bin/env python3
+"""
+Unit tests for date parsing helpers.
+"""
+
+import unittest
+import pandas as pd
+from src.voter_framework.utils.dates import parse_dates
+
+
+class TestParseDates(unittest.TestCase):
+    """Tests for the parse_dates helper."""
+
+    def test_iso_dates(self):
+        """Test that ISO dates parse and missing values become NaT."""
+        parsed = parse_dates(pd.Series(['2000-01-02', None, '1999-12-31']))
+        
+        self.assertEqual(parsed.tolist()[0], pd.Timestamp('2000-01-02'))
+        self.assertTrue(pd.isna(parsed.iloc[1]))
+        self.assertEqual(parsed.tolist()[2], pd.Timestamp('1999-12-31'))
+
+    def test_other_layouts_fall_back_to_inference(self):
+        """Test that non-ISO dates are still parsed."""
+        parsed = parse_dates(pd.Series(['01/02/2000', '03/04/2001']))
+        
+        self.assertEqual(parsed.tolist(), [pd.Timestamp('2000-01-02'), pd.Timestamp('2001-03-04')])
+
+    def test_invalid_dates_raise(self):
+        """Test that unparseable values raise ValueError."""
+        with self.assertRaises(ValueError):
+            parse_dates(pd.Series(['2000-01-02', 'not a date']))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""
+Unit tests for file format detection logic.
+"""
+
+import os
+import shutil
+import tempfile
+import unittest
+from src.voter_framework.cli.onboard_state import detect_file_format
+
+
+class TestFileFormatDetection(unittest.TestCase):
+    """Tests for the file format detection functionality."""
+
+    def setUp(self):
+        """Create a temporary directory for sample files."""
+        self.temp_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        """Remove the temporary directory."""
+        shutil.rmtree(self.temp_dir)
+
+    def _write_sample(self, content: bytes) -> str:
+        """Write raw bytes to a sample file and return its path."""
+        file_path = os.path.join(self.temp_dir, 'sample.csv')
+        with open(file_path, 'wb') as f:
+            f.write(content)
+        return file_path
+
+    def test_pipe_delimited_header(self):
+        """Test detection of a pipe-delimited header."""
+        file_path = self._write_sample(b'StateVoterID|FName|LName\r\n10001|JOHN|DOE\r\n')
+        
+        self.assertEqual(
+            detect_file_format(file_path),
+            ('text', '|', ['StateVoterID', 'FName', 'LName'])
+        )
+
+    def test_pipe_header_with_comma_in_column_name(self):
+        """Test that the most frequent delimiter wins over a stray comma."""
+        file_path = self._write_sample(b'ID|LAST, FIRST|ZIP\n1|DOE, JOHN|98101\n')
+        
+        self.assertEqual(
+            detect_file_format(file_path),
+            ('text', '|', ['ID', 'LAST, FIRST', 'ZIP'])
+        )
+
+    def test_quoted_header_with_delimiter(self):
+        """Test that quoted column names containing the delimiter are kept whole."""
+        file_path = self._write_sample(b'ID,"CITY, STATE",ZIP\n1,"SEATTLE, WA",98101\n')
+        
+        self.assertEqual(
+            detect_file_format(file_path),
+            ('csv', ',', ['ID', 'CITY, STATE', 'ZIP'])
+        )
+
+    def test_non_utf8_header(self):
+        """Test that a header that is not valid UTF-8 is still decoded."""
+        file_path = self._write_sample('ID,Código,ZIP\n'.encode('cp1252'))
+        
+        self.assertEqual(
+            detect_file_format(file_path),
+            ('csv', ',', ['ID', 'Código', 'ZIP'])
+        )
+
+    def test_cp1252_punctuation_header(self):
+        """Test that cp1252-only characters are decoded as cp1252, not latin1."""
+        file_path = self._write_sample('ID,“Name”,ZIP\n'.encode('cp1252'))
+        
+        self.assertEqual(
+            detect_file_format(file_path),
+            ('csv', ',', ['ID', '“Name”', 'ZIP'])
+        )
+
+
+if __name__ == '__main__':
+    unittest.main()
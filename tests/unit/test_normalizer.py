@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the base data normalizer helpers.
+"""
+
+import unittest
+import pandas as pd
+from src.voter_framework.normalizers.base import BaseDataNormalizer
+
+
+class PassThroughNormalizer(BaseDataNormalizer):
+    """Normalizer that returns data unchanged."""
+
+    def normalize(self, data: pd.DataFrame) -> pd.DataFrame:
+        return data
+
+
+class TestBaseDataNormalizer(unittest.TestCase):
+    """Tests for the BaseDataNormalizer helper methods."""
+
+    def setUp(self):
+        """Create a normalizer and a set of raw names."""
+        self.normalizer = PassThroughNormalizer()
+        self.names = [
+            'John', '  MARY   ann ', "O'Brien", 'Smith-Jones', 'José\tÁlvarez',
+            'Anne_Marie', 'Jr. & Sons', '& Co', 'Li 李', '', '   ', None, 'John', None
+        ]
+
+    def test_validate_normalized_data_missing_fields(self):
+        """Test that missing required fields are reported in schema order."""
+        data = pd.DataFrame({'city': ['Salem'], 'first_name': ['Ann'], 'zip_code': ['97301']})
+        
+        validation = self.normalizer.validate_normalized_data(data)
+        
+        self.assertFalse(validation['is_valid'])
+        self.assertEqual(validation['missing_fields'],
+                         ['last_name', 'birth_date', 'registration_date', 'address', 'state'])
+
+    def test_clean_name(self):
+        """Test scalar name cleaning."""
+        self.assertEqual(self.normalizer.clean_name('  MARY   ann '), 'mary ann')
+        self.assertEqual(self.normalizer.clean_name("O'Brien"), 'obrien')
+        self.assertEqual(self.normalizer.clean_name('Anne_Marie #2'), 'annemarie 2')
+        self.assertEqual(self.normalizer.clean_name('José\tÁlvarez-Núñez'), 'josé álvarez-núñez')
+        self.assertEqual(self.normalizer.clean_name(None), '')
+
+    def test_clean_names_matches_clean_name(self):
+        """Test that the vectorized cleaner agrees with the scalar one."""
+        expected = [self.normalizer.clean_name(name) for name in self.names]
+        
+        for dtype in (object, 'string'):
+            with self.subTest(dtype=dtype):
+                cleaned = self.normalizer.clean_names(pd.Series(self.names, dtype=dtype))
+                self.assertEqual(cleaned.tolist(), expected)
+
+    def test_standardize_date(self):
+        """Test scalar date standardization for each accepted layout."""
+        cases = {
+            '2000-01-02': '2000-01-02',
+            '2000-1-2': '2000-01-02',
+            '01/02/2000': '2000-01-02',
+            '1-12-2000': '2000-01-12',
+            '2000/12/01': '2000-12-01',
+            '2000-02-30': None,
+            '20000102': None,
+            'garbage': None,
+            None: None
+        }
+        for date_str, expected in cases.items():
+            with self.subTest(date_str=date_str):
+                self.assertEqual(self.normalizer.standardize_date(date_str), expected)
+
+    def test_standardize_dates_matches_standardize_date(self):
+        """Test that the column date standardizer agrees with the scalar one."""
+        dates = ['2000-01-02', '1/2/2000', '01-02-2000', '2000/01/02', '2000-1-2', '1600-01-01',
+                 '2000-02-30', ' 2000-01-02', '20000102', 'garbage', '', None, '2000-01-02',
+                 # Shapes that pandas' format parser accepts more loosely than strptime
+                 '/08/5', '/6/8', '/1/4', '-08-05', '0020-01-05', '2020-01/05',
+                 '0000-01-01', '0000/1/31', '1/31/0000', '01-31-0000']
+        expected = [self.normalizer.standardize_date(date) for date in dates]
+        
+        for dtype in (object, 'string'):
+            with self.subTest(dtype=dtype):
+                standardized = self.normalizer.standardize_dates(pd.Series(dates, dtype=dtype))
+                self.assertEqual(standardized.tolist(), expected)
+
+
+if __name__ == '__main__':
+    unittest.main()
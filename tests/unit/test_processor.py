@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the voter data processor.
+"""
+
+import unittest
+import pandas as pd
+from src.voter_framework.adapters.base import BaseStateAdapter
+from src.voter_framework.core.processor import VoterDataProcessor
+from src.voter_framework.normalizers.base import BaseDataNormalizer
+
+
+class UpperCaseNormalizer(BaseDataNormalizer):
+    """Normalizer that upper-cases last names."""
+
+    def normalize(self, data: pd.DataFrame) -> pd.DataFrame:
+        normalized = data.copy()
+        normalized['last_name'] = normalized['last_name'].str.upper()
+        return normalized
+
+
+class InMemoryAdapter(BaseStateAdapter):
+    """Adapter serving a fixed in-memory DataFrame."""
+
+    def __init__(self, data: pd.DataFrame):
+        super().__init__('WA')
+        self.data = data
+
+    def fetch_data(self) -> pd.DataFrame:
+        return self.data
+
+    def _create_normalizer(self) -> BaseDataNormalizer:
+        return UpperCaseNormalizer()
+
+    def get_schema_mapping(self):
+        return {}
+
+
+class TestVoterDataProcessor(unittest.TestCase):
+    """Tests for the VoterDataProcessor class."""
+
+    def setUp(self):
+        """Create a processor and an adapter with sample data."""
+        self.processor = VoterDataProcessor()
+        self.adapter = InMemoryAdapter(pd.DataFrame({
+            'first_name': ['John', 'Jane', None, 'Ann', 'Bob'],
+            'last_name': ['Doe', 'Roe', 'Poe', None, 'Loe']
+        }))
+
+    def test_chunked_processing_matches_full_processing(self):
+        """Test that chunked processing gives the same data and metrics as a single pass."""
+        chunked = self.processor.process_state_data_chunked(self.adapter, chunksize=2)
+        chunked_metrics = self.processor.quality_metrics['WA']
+        
+        full = self.processor.process_state_data(self.adapter)
+        
+        pd.testing.assert_frame_equal(chunked, full)
+        self.assertEqual(chunked_metrics, self.processor.quality_metrics['WA'])
+        self.assertEqual(chunked_metrics['missing_values'], {'first_name': 1, 'last_name': 1})
+
+    def test_chunked_processing_of_empty_data(self):
+        """Test that an empty source still yields an empty normalized frame."""
+        self.adapter.data = self.adapter.data.iloc[0:0]
+        
+        result = self.processor.process_state_data_chunked(self.adapter, chunksize=2)
+        
+        self.assertTrue(result.empty)
+        self.assertEqual(list(result.columns), ['first_name', 'last_name'])
+
+    def test_generate_report_keeps_numeric_dtypes(self):
+        """Test that integer min/max stay integers next to float columns."""
+        data = pd.DataFrame({'age': [30, 1, 3], 'score': [0.5, 1.5, 2.0], 'name': ['A', 'B', 'C']})
+        
+        stats = self.processor.generate_report(data, 'WA')['column_statistics']
+        
+        for column in ('age', 'score'):
+            for name in ('min', 'max', 'mean', 'median'):
+                with self.subTest(column=column, statistic=name):
+                    expected = getattr(data[column], name)()
+                    self.assertEqual(stats[column][name], expected)
+                    self.assertEqual(type(stats[column][name]), type(expected))
+        self.assertNotIn('min', stats['name'])
+
+    def test_compare_states_field_comparison(self):
+        """Test that field comparison reports the processed dtypes and null counts."""
+        data = self.processor.process_state_data(self.adapter)
+        
+        comparison = self.processor.compare_states(['WA'])['field_comparison']['WA']
+        
+        self.assertEqual(comparison['columns'], ['first_name', 'last_name'])
+        self.assertEqual(comparison['dtypes'], data.dtypes.to_dict())
+        self.assertEqual(comparison['null_counts'], data.isnull().sum().to_dict())
+
+
+if __name__ == '__main__':
+    unittest.main()
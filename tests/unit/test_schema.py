@@ -0,0 +1,41 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the voter schema.
+"""
+
+import unittest
+from src.voter_framework.core.schema import VoterSchema
+
+
+class TestVoterSchema(unittest.TestCase):
+    """Tests for the VoterSchema class."""
+
+    def test_field_groupings_follow_reassigned_fields(self):
+        """Test that field groupings reflect a field name changed after first access."""
+        schema = VoterSchema()
+        self.assertIn('zip_code', schema.required_fields)
+        self.assertIn('precinct', schema.optional_fields)
+        
+        schema.zip_code = 'zip'
+        schema.precinct = 'precinct_code'
+        
+        self.assertIn('zip', schema.required_fields)
+        self.assertNotIn('zip_code', schema.required_fields)
+        self.assertIn('precinct_code', schema.optional_fields)
+        self.assertEqual(schema.all_fields, schema.required_fields + schema.optional_fields)
+
+    def test_field_type_follows_reassigned_fields(self):
+        """Test that get_field_type uses a field name changed after first lookup."""
+        schema = VoterSchema()
+        self.assertEqual(schema.get_field_type('zip'), 'string')
+        
+        schema.zip_code = 'zip'
+        schema.birth_date = 'dob'
+        
+        self.assertEqual(schema.get_field_type('zip'), 'numeric')
+        self.assertEqual(schema.get_field_type('zip_code'), 'string')
+        self.assertEqual(schema.get_field_type('dob'), 'date')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""
+Unit tests for voter data validation.
+"""
+
+import os
+import tempfile
+import unittest
+import pandas as pd
+from src.voter_framework.core.validator import DataValidator
+
+
+class TestDataValidator(unittest.TestCase):
+    """Tests for the DataValidator class."""
+
+    def setUp(self):
+        """Create a validator and sample address data."""
+        self.validator = DataValidator()
+        self.address_data = pd.DataFrame({
+            'address': ['123 Main St', '456 Oak Ave', '789 Pine Rd', '1 Elm St', '2 Ash Ct'],
+            'city': ['Seattle', 'Portland', 'Salem', 'Tacoma', 'Olympia'],
+            'state': ['WA', 'OR', 'wa', None, 'ZZ'],
+            'zip_code': ['98101', '97201-1234', '9730', None, 'ABCDE']
+        })
+
+    def test_validate_address_counts_invalid_values(self):
+        """Test that invalid ZIP and state codes are counted, including missing values."""
+        validation = self.validator.validate_address(self.address_data)
+        
+        self.assertTrue(validation['is_valid'])
+        self.assertEqual(validation['warnings'], [
+            'Found 3 invalid ZIP codes',
+            'Found 3 invalid state codes'
+        ])
+
+    def test_validate_address_missing_fields(self):
+        """Test that missing address fields make the data invalid."""
+        validation = self.validator.validate_address(self.address_data[['address', 'city']])
+        
+        self.assertFalse(validation['is_valid'])
+        self.assertEqual(validation['errors'], ["Missing required address fields: ['state', 'zip_code']"])
+
+    def test_validate_reports_empty_names(self):
+        """Test that empty and missing names are reported."""
+        data = self.address_data.assign(
+            first_name=['John', '', None, 'Ann', 'Bob'],
+            last_name=['Doe', 'Roe', 'Poe', 'Loe', 'Moe']
+        )
+        
+        validation = self.validator.validate(data)
+        
+        self.assertIn('Found 2 empty first_names', validation['warnings'])
+        self.assertFalse(any('last_name' in warning for warning in validation['warnings']))
+
+    def test_validate_typed_columns_need_no_parsing(self):
+        """Test that datetime and numeric columns pass type validation as-is."""
+        data = self.address_data.assign(
+            birth_date=pd.to_datetime(['1980-01-01', '1975-06-15', '1990-12-31', '2000-02-29', '1965-07-04']),
+            precinct=[101, 102, 103, 104, 105]
+        )
+        
+        validation = self.validator.validate(data)
+        
+        self.assertFalse(any('birth_date' in warning or 'precinct' in warning
+                             for warning in validation['warnings']))
+
+    def test_validate_empty_data_checks_columns_only(self):
+        """Test that empty data only gets the required-field check."""
+        validation = self.validator.validate(self.address_data.iloc[0:0])
+        
+        self.assertFalse(validation['is_valid'])
+        self.assertEqual(len(validation['errors']), 1)
+        self.assertEqual(validation['warnings'], [])
+
+    def test_validate_chunked_matches_validate(self):
+        """Test that chunked file validation sums to the whole-frame result."""
+        data = self.address_data.assign(
+            first_name=['John', '', None, 'Ann', 'Bob'],
+            last_name=['Doe', 'Roe', 'Poe', 'Loe', 'Moe']
+        )
+        with tempfile.TemporaryDirectory() as temp_dir:
+            file_path = os.path.join(temp_dir, 'voters.csv')
+            data.to_csv(file_path, index=False)
+            
+            chunked = self.validator.validate_chunked(file_path, chunksize=2)
+            whole = self.validator.validate(pd.read_csv(file_path, dtype=str))
+        
+        self.assertEqual(chunked, whole)
+        self.assertIn('Found 3 invalid ZIP codes', chunked['warnings'])
+
+    def test_validate_chunked_tracks_date_layout_across_chunks(self):
+        """Test that a date layout change between chunks is reported like validate()."""
+        data = self.address_data.assign(
+            birth_date=['2000-01-02', '2000-01-03', '01/05/2000', '01/06/2000', '01/07/2000']
+        )
+        with tempfile.TemporaryDirectory() as temp_dir:
+            file_path = os.path.join(temp_dir, 'voters.csv')
+            data.to_csv(file_path, index=False)
+            
+            chunked = self.validator.validate_chunked(file_path, chunksize=2)
+            whole = self.validator.validate(pd.read_csv(file_path, dtype=str))
+        
+        self.assertEqual(chunked, whole)
+        self.assertTrue(any('birth_date' in warning for warning in chunked['warnings']))
+
+    def test_validation_cache(self):
+        """Test that cached results are reused but changed data is revalidated."""
+        validator = DataValidator(cache_size=2)
+        data = self.address_data.copy()
+        
+        first = validator.validate(data)
+        first['warnings'].append('caller edit')
+        self.assertEqual(validator.validate(data), self.validator.validate(data))
+        
+        data.loc[0, 'zip_code'] = 'bad'
+        self.assertIn('Found 4 invalid ZIP codes', validator.validate(data)['warnings'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+"""
+Unit tests for ZIP code validation.
+"""
+
+import importlib.util
+import unittest
+import pandas as pd
+from src.voter_framework.utils.zip_codes import valid_zip_mask
+
+
+class TestValidZipMask(unittest.TestCase):
+    """Tests for the valid_zip_mask helper."""
+
+    def test_string_values(self):
+        """Test five-digit and ZIP+4 codes against malformed values."""
+        zip_codes = ['98101', '98101-1234', '9810', '981011', '98101-123', '98101-12345',
+                     '98101 1234', 'ABCDE', '', '98101-1234-5678', '٩٨١٠١']
+        expected = [True, True, False, False, False, False, False, False, False, False, False]
+        
+        for dtype in (object, 'string'):
+            with self.subTest(dtype=dtype):
+                mask = valid_zip_mask(pd.Series(zip_codes, dtype=dtype))
+                self.assertEqual(mask.tolist(), expected)
+
+    def test_missing_values_are_invalid(self):
+        """Test that missing values are flagged as invalid."""
+        mask = valid_zip_mask(pd.Series(['98101', None, float('nan')], dtype=object))
+        
+        self.assertEqual(mask.tolist(), [True, False, False])
+
+    def test_non_string_values_are_invalid(self):
+        """Test that non-string values in a mixed column are flagged as invalid."""
+        mask = valid_zip_mask(pd.Series(['98101', 98101], dtype=object))
+        
+        self.assertEqual(mask.tolist(), [True, False])
+
+    def test_embedded_nul_is_invalid(self):
+        """Test that a NUL character does not end the value early."""
+        zip_codes = ['07053\x005', '07053\x00', '07053-1234\x00', '07053\x00\x00\x00\x00\x00\x00']
+        
+        for dtype in (object, 'string'):
+            with self.subTest(dtype=dtype):
+                mask = valid_zip_mask(pd.Series(zip_codes, dtype=dtype))
+                self.assertEqual(mask.tolist(), [False, False, False, False])
+
+    @unittest.skipUnless(importlib.util.find_spec('pyarrow'), 'pyarrow is not installed')
+    def test_arrow_backed_values(self):
+        """Test that Arrow-backed columns give the same mask as object columns."""
+        zip_codes = ['98101', '98101-1234', '9810', None, '98101\n', '٩٨١٠١']
+        
+        mask = valid_zip_mask(pd.Series(zip_codes, dtype='string[pyarrow]'))
+        
+        self.assertEqual(mask.tolist(), valid_zip_mask(pd.Series(zip_codes, dtype=object)).tolist())
+
+
+if __name__ == '__main__':
+    unittest.main()